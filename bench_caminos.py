@@ -0,0 +1,48 @@
+import sys
+import tracemalloc
+
+from laberinto import CompactPath, MazeSolver, Solution, SolutionTrie
+
+
+def measure(build):
+    tracemalloc.start()
+    data = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return data, current
+
+
+def build_trie(size, cells):
+    trie = SolutionTrie(size)
+    for path in cells:
+        trie.add(path, 0.0)
+    return trie
+
+
+def main():
+    # Laberinto abierto: el número de caminos simples crece muy rápido con el tamaño
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    maze_string = '0' + ' ' * (size * size - 2) + 'X'
+
+    solver = MazeSolver(size, maze_string, 0, render=False)
+    solver._find_all_solutions()
+    solutions = solver.solutions
+    steps = sum(sol.length for sol in solutions)
+
+    cells = [list(sol.path) for sol in solutions]
+    _, list_bytes = measure(lambda: [Solution([(x, y) for x, y in path], 0.0, len(path))
+                                     for path in cells])
+    _, compact_bytes = measure(lambda: [Solution(CompactPath.from_cells(path), 0.0, len(path))
+                                        for path in cells])
+    trie, trie_bytes = measure(lambda: build_trie(size, cells))
+
+    print(f"Laberinto abierto {size}x{size}: {len(solutions)} soluciones, {steps} pasos en total")
+    print(f"Lista de tuplas: {list_bytes:>12} bytes ({list_bytes / steps:.1f} bytes/paso)")
+    print(f"CompactPath:     {compact_bytes:>12} bytes ({compact_bytes / steps:.1f} bytes/paso)")
+    print(f"SolutionTrie:    {trie_bytes:>12} bytes ({trie.node_count} nodos)")
+    print(f"Reducción: {list_bytes / compact_bytes:.1f}x compacto, "
+          f"{list_bytes / trie_bytes:.1f}x árbol de prefijos")
+
+
+if __name__ == "__main__":
+    main()
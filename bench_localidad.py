@@ -0,0 +1,59 @@
+import sys
+import time
+
+from laberinto_busqueda import GridMaze
+from laberinto_curvas import ORDERS
+from laberinto_generador import generate
+from laberinto_grafo import MazeGraph, bfs
+
+# Entradas de array('i') por línea de caché de 64 bytes y por página de 4 KiB
+LINE = 16
+PAGE = 1024
+
+
+def locality(graph):
+    # Fracción de aristas cuyos dos extremos comparten línea de caché o página
+    # en los arrays indexados por nodo (parents, costs, offsets)
+    same_line = same_page = 0
+    for node in range(len(graph)):
+        for nxt in graph.adjacent(node):
+            same_line += node // LINE == nxt // LINE
+            same_page += node // PAGE == nxt // PAGE
+    edges = len(graph.neighbors) or 1
+    return same_line / edges, same_page / edges
+
+
+def best_time(run, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1001
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    grid = GridMaze(size, generate(size, 'kruskal', 1, loops=0.1))
+    start, end = grid.find('0'), grid.find('X')
+
+    print(f"Laberinto {size}x{size}, BFS de '0' a 'X', mejor de {repeat}")
+    expected = None
+    for order in ORDERS:
+        started = time.perf_counter()
+        graph = MazeGraph.compile(grid, order)
+        compile_seconds = time.perf_counter() - started
+        path = bfs(graph, start, end)
+        if expected is None:
+            expected = path
+        assert path == expected, f"la BFS con orden {order} no coincide"
+        line, page = locality(graph)
+        seconds = best_time(lambda: bfs(graph, start, end), repeat)
+        print(f"{order:>8}: compilación {compile_seconds:6.3f} s, BFS {seconds:6.3f} s, "
+              f"aristas en la misma línea {line:6.1%}, en la misma página {page:6.1%}")
+
+
+if __name__ == "__main__":
+    main()
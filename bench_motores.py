@@ -0,0 +1,197 @@
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from laberinto import MazeSolver, SearchInstrumentation
+from laberinto_busqueda import GridMaze, astar, bfs
+from laberinto_generador import generate
+from laberinto_grafo import MazeGraph, all_paths, astar as graph_astar, bfs as graph_bfs
+
+DRAFTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'drafts')
+
+FAMILIES = {
+    'backtracker': {'algorithm': 'backtracker'},
+    'kruskal': {'algorithm': 'kruskal'},
+    'wilson': {'algorithm': 'wilson'},
+    'trenzado': {'algorithm': 'kruskal', 'loops': 0.15},
+}
+
+# Los motores que enumeran todos los caminos son exponenciales en laberintos
+# con ciclos, así que sólo se ejecutan hasta estos tamaños
+ENUMERATION_LIMITS = {'backtracker': 61, 'kruskal': 61, 'wilson': 61, 'trenzado': 15}
+
+
+def _load_draft(name):
+    spec = importlib.util.spec_from_file_location(f"draft_{name}", os.path.join(DRAFTS, f"{name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _count_valid(obj, method, counter):
+    original = getattr(obj, method)
+
+    def wrapper(*args):
+        valid = original(*args)
+        if valid:
+            counter['expanded'] += 1
+        return valid
+    setattr(obj, method, wrapper)
+
+
+def run_maze_solver(size, maze):
+    instrumentation = SearchInstrumentation()
+    solver = MazeSolver(size, maze, 0, render=False, instrumentation=instrumentation)
+    solver._find_all_solutions()
+    lengths = [sol.length for sol in solver.solutions]
+    return len(lengths), min(lengths, default=None), instrumentation.counters['push']
+
+
+def run_draft(module_name, size, maze):
+    module = _load_draft(module_name)
+    solver = module.Laberinto(size, maze, 0)
+    solver._imprimir_laberinto = lambda: None
+    counter = {'expanded': 0}
+    _count_valid(solver, '_es_movimiento_valido', counter)
+    with contextlib.redirect_stdout(io.StringIO()):
+        solver.resolver()
+    lengths = [sol.longitud for sol in solver.soluciones]
+    return len(lengths), min(lengths, default=None), counter['expanded']
+
+
+def run_engine(engine, size, maze):
+    grid = GridMaze(size, maze)
+    counters = {}
+    path = engine(grid, grid.find('0'), grid.find('X'), counters)
+    return (0 if path is None else 1), (None if path is None else len(path)), counters['expanded']
+
+
+def run_graph_engine(engine, size, maze):
+    # La compilación del grafo CSR cuenta dentro del tiempo medido
+    grid = GridMaze(size, maze)
+    graph = MazeGraph.compile(grid)
+    counters = {}
+    path = engine(graph, grid.find('0'), grid.find('X'), counters)
+    return (0 if path is None else 1), (None if path is None else len(path)), counters['expanded']
+
+
+def run_graph_enumeration(size, maze):
+    grid = GridMaze(size, maze)
+    graph = MazeGraph.compile(grid)
+    counters = {}
+    lengths = [len(path) for path in all_paths(graph, grid.find('0'), grid.find('X'), counters)]
+    return len(lengths), min(lengths, default=None), counters['expanded']
+
+
+ENGINES = {
+    'maze_solver': (True, run_maze_solver),
+    'recursivo': (True, lambda size, maze: run_draft('recursivo', size, maze)),
+    'no_recursivo': (False, lambda size, maze: run_draft('no_recursivo', size, maze)),
+    'bfs': (False, lambda size, maze: run_engine(bfs, size, maze)),
+    'astar': (False, lambda size, maze: run_engine(astar, size, maze)),
+    'enumeracion_csr': (True, run_graph_enumeration),
+    'bfs_csr': (False, lambda size, maze: run_graph_engine(graph_bfs, size, maze)),
+    'astar_csr': (False, lambda size, maze: run_graph_engine(graph_astar, size, maze)),
+}
+
+
+def measure(run, size, maze):
+    start = time.perf_counter()
+    solutions, shortest, expanded = run(size, maze)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    run(size, maze)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'wall_time': elapsed,
+        'peak_memory': peak,
+        'nodes_expanded': expanded,
+        'solutions': solutions,
+        'shortest': shortest,
+    }
+
+
+def run_matrix(families, sizes, engines, seed):
+    results = []
+    for family in families:
+        for size in sizes:
+            maze = generate(size, seed=seed, **FAMILIES[family])
+            entry = {'family': family, 'size': size, 'seed': seed, 'engines': {}}
+            for name in engines:
+                enumerates, run = ENGINES[name]
+                if enumerates and size > ENUMERATION_LIMITS[family]:
+                    continue
+                entry['engines'][name] = measure(run, size, maze)
+                print(f"{family:>12} {size:>5} {name:>13}: "
+                      f"{entry['engines'][name]['wall_time']:.4f} s", file=sys.stderr)
+            entry['agree'] = _check_agreement(entry['engines'])
+            results.append(entry)
+    return results
+
+
+def _check_agreement(engines):
+    shortest = {r['shortest'] for r in engines.values()}
+    counts = {engines[name]['solutions'] for name in ('maze_solver', 'recursivo', 'enumeracion_csr')
+              if name in engines}
+    return len(shortest) <= 1 and len(counts) <= 1
+
+
+def compare(results, previous, threshold):
+    # Marca como regresión cualquier motor cuyo tiempo crezca más que threshold
+    before = {(e['family'], e['size'], name): r['wall_time']
+              for e in previous['results'] for name, r in e['engines'].items()}
+    regressions = []
+    for entry in results:
+        for name, r in entry['engines'].items():
+            old = before.get((entry['family'], entry['size'], name))
+            if old and r['wall_time'] > old * (1 + threshold):
+                regressions.append({'family': entry['family'], 'size': entry['size'],
+                                    'engine': name, 'before': old, 'after': r['wall_time']})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara los motores de resolución de laberintos")
+    parser.add_argument('--families', nargs='+', default=list(FAMILIES), choices=list(FAMILIES))
+    parser.add_argument('--sizes', nargs='+', type=int, default=[11, 21, 41])
+    parser.add_argument('--engines', nargs='+', default=list(ENGINES), choices=list(ENGINES))
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', default='bench_output.txt')
+    parser.add_argument('--compare', help="resultados JSON de una ejecución anterior")
+    parser.add_argument('--threshold', type=float, default=0.25)
+    args = parser.parse_args()
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10 * max(args.sizes) ** 2))
+    results = run_matrix(args.families, args.sizes, args.engines, args.seed)
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    if args.compare:
+        with open(args.compare) as f:
+            report['regressions'] = compare(results, json.load(f), args.threshold)
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    disagreements = [e for e in results if not e['agree']]
+    for e in disagreements:
+        print(f"Los motores no coinciden en {e['family']} {e['size']}x{e['size']}")
+    for r in report.get('regressions', []):
+        print(f"Regresión: {r['engine']} en {r['family']} {r['size']}x{r['size']}: "
+              f"{r['before']:.4f} s -> {r['after']:.4f} s")
+    print(f"Resultados guardados en {args.output}")
+
+
+if __name__ == "__main__":
+    main()
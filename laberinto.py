@@ -1,6 +1,19 @@
 import time
 import os
+import argparse
+import heapq
+import json
+import pickle
+import random
+import signal
+import zlib
+from array import array
 
+from laberinto_bits import BitMaze
+from laberinto_busqueda import MOVES, GridMaze, k_shortest_paths
+from laberinto_grafo import MazeGraph, bfs as graph_bfs, nearest_goals
+
+DIRECTION_CODES = {move: code for code, move in enumerate(MOVES)}
 
 
 class Node:
@@ -28,6 +41,11 @@ class Stack:
         self.top = self.top.next
         self.size -= 1
         return coords
+    
+    def peek(self):
+        if not self.top:
+            return None
+        return (self.top.x, self.top.y)
 
 class Queue:
     def __init__(self):
@@ -64,22 +82,393 @@ class TreeNode:
         self.parent = parent
         self.children = []
 
+# Camino compacto: celda inicial + un movimiento de 2 bits por paso
+class CompactPath:
+    __slots__ = ('start', 'moves', 'count')
+    
+    def __init__(self, start, moves, count):
+        self.start = start
+        self.moves = moves
+        self.count = count
+    
+    @classmethod
+    def from_cells(cls, cells):
+        packed = bytearray((len(cells) + 2) // 4)
+        for i in range(1, len(cells)):
+            (x0, y0), (x1, y1) = cells[i - 1], cells[i]
+            code = DIRECTION_CODES[(x1 - x0, y1 - y0)]
+            packed[(i - 1) >> 2] |= code << (((i - 1) & 3) << 1)
+        return cls(cells[0], bytes(packed), len(cells) - 1)
+    
+    def __len__(self):
+        return self.count + 1
+    
+    def __iter__(self):
+        x, y = self.start
+        yield (x, y)
+        moves = self.moves
+        for i in range(self.count):
+            dx, dy = MOVES[(moves[i >> 2] >> ((i & 3) << 1)) & 3]
+            x += dx
+            y += dy
+            yield (x, y)
+    
+    def __eq__(self, other):
+        if not isinstance(other, CompactPath):
+            return NotImplemented
+        return (self.start == other.start and
+                self.count == other.count and
+                self.moves == other.moves)
+    
+    def __hash__(self):
+        return hash((self.start, self.count, self.moves))
+    
+    def __repr__(self):
+        return f"CompactPath({list(self)!r})"
+
 class Solution:
+    __slots__ = ('path', 'time_found', 'length')
+    
     def __init__(self, path, time_found, length):
         self.path = path
         self.time_found = time_found
         self.length = length
 
+# Almacén por defecto: una lista de soluciones con caminos compactos
+class SolutionList(list):
+    def add(self, path, time_found):
+        self.append(Solution(CompactPath.from_cells(path), time_found, len(path)))
+    
+    def shortest(self):
+        return min(self, key=lambda x: x.length)
+    
+    def longest(self):
+        return max(self, key=lambda x: x.length)
+    
+    def average_time(self):
+        return sum(sol.time_found for sol in self) / len(self)
+
+# Árbol de prefijos guardado en arreglos paralelos (padre, celda, hijos, profundidad).
+# Cada solución es sólo el índice de su hoja, así la memoria crece con los nodos
+# distintos del árbol y no con la longitud total de los caminos.
+class SolutionTrie:
+    def __init__(self, size):
+        self.size = size
+        self.parent = array('i')
+        self.cell = array('i')
+        self.child_count = array('i')
+        self.depth = array('i')
+        self.leaves = array('i')
+        self.times = array('d')
+        self._last_nodes = []
+    
+    def add(self, path, time_found):
+        # El enumerador produce los caminos en orden DFS, así que el prefijo
+        # común más largo siempre es el compartido con la solución anterior
+        nodes = self._last_nodes
+        size = self.size
+        shared = 0
+        limit = min(len(nodes), len(path))
+        while (shared < limit and
+               self.cell[nodes[shared]] == path[shared][0] * size + path[shared][1]):
+            shared += 1
+        del nodes[shared:]
+        
+        parent = nodes[-1] if nodes else -1
+        for x, y in path[shared:]:
+            node = len(self.cell)
+            self.parent.append(parent)
+            self.cell.append(x * size + y)
+            self.child_count.append(0)
+            self.depth.append(len(nodes))
+            if parent >= 0:
+                self.child_count[parent] += 1
+            nodes.append(node)
+            parent = node
+        
+        self.leaves.append(nodes[-1])
+        self.times.append(time_found)
+    
+    def __len__(self):
+        return len(self.leaves)
+    
+    def __iter__(self):
+        for i in range(len(self.leaves)):
+            yield self.solution(i)
+    
+    @property
+    def node_count(self):
+        return len(self.cell)
+    
+    def cells(self, node):
+        path = []
+        while node >= 0:
+            path.append(divmod(self.cell[node], self.size))
+            node = self.parent[node]
+        path.reverse()
+        return path
+    
+    def solution(self, i):
+        leaf = self.leaves[i]
+        return Solution(CompactPath.from_cells(self.cells(leaf)), self.times[i],
+                        self.depth[leaf] + 1)
+    
+    def tree_node(self, node):
+        # Reconstruye la rama hasta node como una cadena de TreeNode
+        current = None
+        for x, y in self.cells(node):
+            child = TreeNode(x, y, current)
+            if current is not None:
+                current.children.append(child)
+            current = child
+        return current
+    
+    def shortest(self):
+        return self.solution(min(range(len(self.leaves)),
+                                 key=lambda i: self.depth[self.leaves[i]]))
+    
+    def longest(self):
+        return self.solution(max(range(len(self.leaves)),
+                                 key=lambda i: self.depth[self.leaves[i]]))
+    
+    def sample(self, k, rng=random):
+        return [self.solution(i) for i in rng.sample(range(len(self.leaves)), k)]
+    
+    def average_time(self):
+        return sum(self.times) / len(self.times)
+
+# Retención acotada: sólo las k soluciones más cortas y las k más largas,
+# en dos montículos de tamaño k (empates por orden de descubrimiento)
+class TopKSolutions:
+    def __init__(self, k=10):
+        if k < 1:
+            raise ValueError("k debe ser al menos 1")
+        self.k = k
+        self.count = 0
+        self.total_time = 0.0
+        self._shortest = []
+        self._longest = []
+    
+    def add(self, path, time_found):
+        seq = self.count
+        self.count += 1
+        self.total_time += time_found
+        length = len(path)
+        solution = None
+        
+        if len(self._shortest) < self.k or (-length, -seq) > self._shortest[0][:2]:
+            solution = Solution(CompactPath.from_cells(path), time_found, length)
+            entry = (-length, -seq, solution)
+            if len(self._shortest) < self.k:
+                heapq.heappush(self._shortest, entry)
+            else:
+                heapq.heapreplace(self._shortest, entry)
+        
+        if len(self._longest) < self.k or (length, -seq) > self._longest[0][:2]:
+            if solution is None:
+                solution = Solution(CompactPath.from_cells(path), time_found, length)
+            entry = (length, -seq, solution)
+            if len(self._longest) < self.k:
+                heapq.heappush(self._longest, entry)
+            else:
+                heapq.heapreplace(self._longest, entry)
+    
+    def __len__(self):
+        return self.count
+    
+    def shortest_k(self):
+        return [entry[2] for entry in sorted(self._shortest, reverse=True)]
+    
+    def longest_k(self):
+        return [entry[2] for entry in sorted(self._longest, reverse=True)]
+    
+    def shortest(self):
+        return max(self._shortest)[2]
+    
+    def longest(self):
+        return max(self._longest)[2]
+    
+    def average_time(self):
+        return self.total_time / self.count
+
+# Contadores con nombre y ganchos por evento para observar la búsqueda.
+# Cuando MazeSolver.instrumentation es None el enumerador no hace nada extra.
+class SearchInstrumentation:
+    LABELS = {
+        'push': "Celdas apiladas (push)",
+        'pop': "Celdas desapiladas (pop)",
+        'max_depth': "Profundidad máxima de la pila",
+        'rejected_wall': "Movimientos rechazados por pared",
+        'rejected_visited': "Movimientos rechazados por celda visitada",
+        'rejected_bounds': "Movimientos rechazados por borde",
+        'backtracks': "Retrocesos",
+        'solutions': "Soluciones",
+        'max_backtracks_per_solution': "Máximo de retrocesos entre soluciones",
+    }
+    
+    def __init__(self):
+        self.counters = dict.fromkeys(self.LABELS, 0)
+        self.hooks = {}
+        self._backtracks_since_solution = 0
+    
+    def on(self, event, callback):
+        self.hooks.setdefault(event, []).append(callback)
+    
+    def emit(self, event, *args):
+        for callback in self.hooks.get(event, ()):
+            callback(*args)
+    
+    def push(self, x, y, depth):
+        self.counters['push'] += 1
+        if depth > self.counters['max_depth']:
+            self.counters['max_depth'] = depth
+        self.emit('push', x, y, depth)
+    
+    def pop(self, x, y, depth, backtrack):
+        self.counters['pop'] += 1
+        if backtrack:
+            self.counters['backtracks'] += 1
+            self._backtracks_since_solution += 1
+        self.emit('pop', x, y, depth)
+    
+    def reject(self, x, y, reason):
+        self.counters['rejected_' + reason] += 1
+        self.emit('reject', x, y, reason)
+    
+    def solution(self, length):
+        self.counters['solutions'] += 1
+        if self._backtracks_since_solution > self.counters['max_backtracks_per_solution']:
+            self.counters['max_backtracks_per_solution'] = self._backtracks_since_solution
+        self.emit('solution', length, self._backtracks_since_solution)
+        self._backtracks_since_solution = 0
+    
+    def to_json(self):
+        return json.dumps({'counters': self.counters})
+    
+    def print_summary(self):
+        print("\nInstrumentación de la búsqueda:")
+        for name, value in self.counters.items():
+            print(f"{self.LABELS.get(name, name)}: {value}")
+        if self.counters['solutions']:
+            average = self.counters['backtracks'] / self.counters['solutions']
+            print(f"Retrocesos promedio por solución: {average:.1f}")
+
+# Separa el tiempo de búsqueda del tiempo dedicado a dibujar y esperar
+class SearchTimer:
+    def __init__(self):
+        self.started_ns = None
+        self.finished_ns = None
+        self.render_ns = 0
+    
+    def start(self):
+        self.started_ns = time.perf_counter_ns()
+        self.finished_ns = None
+        self.render_ns = 0
+    
+    def stop(self):
+        self.finished_ns = time.perf_counter_ns()
+    
+    def elapsed_ns(self):
+        if self.started_ns is None:
+            return 0
+        end = self.finished_ns if self.finished_ns is not None else time.perf_counter_ns()
+        return end - self.started_ns
+    
+    def compute_seconds(self):
+        return (self.elapsed_ns() - self.render_ns) / 1e9
+    
+    def render_seconds(self):
+        return self.render_ns / 1e9
+
+# Guarda el estado de la enumeración (camino, siguiente movimiento por nivel,
+# soluciones, contadores y tiempo) cada cierto intervalo o al recibir SIGTERM
+class Checkpointer:
+    CHECK_EVERY = 4096
+    
+    def __init__(self, path, interval=60.0):
+        self.path = path
+        self.interval = interval
+        self.stop_requested = False
+        self._last_save = time.monotonic()
+        self._previous_handler = None
+    
+    # El manejador sólo está activo mientras corre la enumeración; fuera de
+    # ella (preguntas de entrada, otros modos) SIGTERM termina el proceso
+    def install_signal_handler(self):
+        self._previous_handler = signal.signal(signal.SIGTERM, self._request_stop)
+        self._last_save = time.monotonic()
+    
+    def restore_signal_handler(self):
+        signal.signal(signal.SIGTERM, self._previous_handler)
+        self._previous_handler = None
+    
+    def _request_stop(self, signum, frame):
+        self.stop_requested = True
+    
+    def due(self):
+        return (self.stop_requested or
+                time.monotonic() - self._last_save >= self.interval)
+    
+    def save(self, solver, path, next_move):
+        instr = solver.instrumentation
+        state = {
+            'size': solver.size,
+            'maze': solver.grid.cells.decode('latin-1'),
+            'delay_ms': round(solver.delay * 1000),
+            'path': array('i', [x * solver.size + y for x, y in path]).tobytes(),
+            'next_move': bytes(next_move),
+            'solutions': solver.solutions,
+            'compute_ns': solver.timer.elapsed_ns() - solver.timer.render_ns,
+            'counters': None if instr is None else instr.counters,
+            'backtracks_since_solution': None if instr is None else instr._backtracks_since_solution,
+        }
+        data = zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+        temporary = self.path + '.tmp'
+        with open(temporary, 'wb') as f:
+            f.write(data)
+        os.replace(temporary, self.path)
+        self._last_save = time.monotonic()
+    
+    @staticmethod
+    def load(path):
+        with open(path, 'rb') as f:
+            return pickle.loads(zlib.decompress(f.read()))
+
 class MazeSolver:
-    def __init__(self, size, maze_string, delay_ms):
+    def __init__(self, size, maze_string, delay_ms, render=True, solutions=None,
+                 instrumentation=None, checkpointer=None, cache=None):
         self.size = size
         self.maze = [list(maze_string[i:i+size]) for i in range(0, len(maze_string), size)]
+        self.grid = GridMaze(size, maze_string)
         self.delay = delay_ms / 1000
+        self.render = render
         self.start = self._find_position('0')
         self.end = self._find_position('X')
-        self.solutions = []
+        self.solutions = solutions if solutions is not None else SolutionList()
+        self.instrumentation = instrumentation
+        self.checkpointer = checkpointer
+        self.cache = cache
+        self.interrupted = False
         self.current_position = self.start
-        self.start_time = time.time()
+        self.timer = SearchTimer()
+        self._resume = None
+    
+    @classmethod
+    def from_checkpoint(cls, state, render=True, instrumentation=None, checkpointer=None):
+        solver = cls(state['size'], state['maze'], state['delay_ms'], render,
+                     state['solutions'], instrumentation, checkpointer)
+        if state['counters'] is not None:
+            if solver.instrumentation is None:
+                solver.instrumentation = SearchInstrumentation()
+            solver.instrumentation.counters.update(state['counters'])
+            solver.instrumentation._backtracks_since_solution = state['backtracks_since_solution']
+        cells = array('i')
+        cells.frombytes(state['path'])
+        solver._resume = ([divmod(cell, solver.size) for cell in cells],
+                          list(state['next_move']))
+        solver.timer.start()
+        solver.timer.started_ns -= state['compute_ns']
+        return solver
     
     def _find_position(self, char):
         for i in range(self.size):
@@ -88,13 +477,30 @@ class MazeSolver:
                     return (i, j)
         return (-1, -1)
     
+    def _find_all_positions(self, char):
+        return [(i, j) for i in range(self.size) for j in range(self.size)
+                if self.maze[i][j] == char]
+    
     def _is_valid_move(self, x, y, visited):
         return (0 <= x < self.size and 
                 0 <= y < self.size and 
                 self.maze[x][y] != '+' and 
                 (x, y) not in visited)
     
+    def _rejection_reason(self, x, y):
+        if not (0 <= x < self.size and 0 <= y < self.size):
+            return 'bounds'
+        if self.maze[x][y] == '+':
+            return 'wall'
+        return 'visited'
+    
     def _move_to(self, x, y, visited):
+        if self.instrumentation is not None:
+            self.instrumentation.emit('move', x, y)
+        if not self.render:
+            self.current_position = (x, y)
+            return
+        
         old_x, old_y = self.current_position
         
         if self.maze[old_x][old_y] not in ['0', 'X']:
@@ -110,6 +516,7 @@ class MazeSolver:
         self._print_maze()
     
     def _print_maze(self):
+        started = time.perf_counter_ns()
         os.system('cls' if os.name == 'nt' else 'clear')
         print("+" + "-" * (self.size * 3) + "+")
         for i in range(self.size):
@@ -123,71 +530,210 @@ class MazeSolver:
             print("|")
         print("+" + "-" * (self.size * 3) + "+")
         time.sleep(self.delay)
+        self.timer.render_ns += time.perf_counter_ns() - started
     
     def solve(self):
         if not self._verify_maze():
             print("El laberinto no es válido o no tiene solución posible.")
             return
         
-        self._find_all_solutions()
+        if self.cache is not None:
+            summary = self.cache.lookup(*self._cache_request())
+            if summary is not None:
+                print("\nResultado recuperado de la caché.")
+                self._print_final_statistics(summary)
+                return
+        
+        if self._resume is None:
+            self.timer.start()
+        if self.checkpointer is not None:
+            self.checkpointer.install_signal_handler()
+        try:
+            self._find_all_solutions()
+        finally:
+            if self.checkpointer is not None:
+                self.checkpointer.restore_signal_handler()
+        self.timer.stop()
+        if self.interrupted:
+            print(f"\nBúsqueda interrumpida. Punto de control guardado en {self.checkpointer.path}")
+            return
+        summary = self._summary()
+        if self.cache is not None:
+            self.cache.store(*self._cache_request(), summary)
+        self._print_final_statistics(summary)
+        if self.instrumentation is not None:
+            self.instrumentation.print_summary()
+    
+    def solve_nearest(self):
+        # Varios inicios y varias metas: una sola BFS multifuente en lugar de
+        # una búsqueda por cada par
+        starts = self._find_all_positions('0')
+        goals = self._find_all_positions('X')
+        if not starts or not goals:
+            print("El laberinto no es válido o no tiene solución posible.")
+            return
+        
+        self.timer.start()
+        nearest, path = nearest_goals(MazeGraph.compile(self.grid), starts, goals)
+        self.timer.stop()
+        
+        print(f"\n{len(starts)} inicios y {len(goals)} metas:")
+        for start in starts:
+            if nearest[start] is None:
+                print(f"Inicio {start}: ninguna meta alcanzable")
+            else:
+                goal, distance = nearest[start]
+                # Igual que en el resto de informes, 'pasos' cuenta celdas del camino
+                print(f"Inicio {start}: meta más cercana {goal} a {distance + 1} pasos")
+        if path is None:
+            print("\nNo se encontraron soluciones.")
+            return
+        print(f"\nMejor par: {path[0]} -> {path[-1]} a {len(path)} pasos")
+        self._print_solution(path)
+        print(f"Tiempo de búsqueda: {self.timer.compute_seconds():.3f} segundos")
+    
+    def solve_k_shortest(self, k):
+        if not self._verify_maze():
+            print("El laberinto no es válido o no tiene solución posible.")
+            return
+        
+        # Cada ruta se muestra en cuanto Yen la da por definitiva
+        print(f"\nLas {k} rutas más cortas:")
+        self.timer.start()
+        graph = MazeGraph.compile(self.grid)
+        for i, path in enumerate(k_shortest_paths(graph, self.start, self.end, k,
+                                                  engine=graph_bfs), 1):
+            found = self.timer.compute_seconds()
+            self.solutions.add(path, found)
+            started = time.perf_counter_ns()
+            print(f"{i:>3}. {len(path)} pasos ({found:.3f} segundos)")
+            if self.render:
+                self._print_solution(path)
+            self.timer.render_ns += time.perf_counter_ns() - started
+        self.timer.stop()
         self._print_final_statistics()
     
+    def _cache_request(self):
+        options = {'store': type(self.solutions).__name__}
+        if hasattr(self.solutions, 'k'):
+            options['k'] = self.solutions.k
+        return (self.grid.cells.decode('latin-1'), self.size, 'maze_solver', options)
+    
     def _verify_maze(self):
+        # La alcanzabilidad se comprueba inundando el tablero de bits, sin
+        # recorrer las celdas una a una
         return (self.start != (-1, -1) and 
                 self.end != (-1, -1) and 
-                self.start != self.end)
+                self.start != self.end and
+                BitMaze(self.grid).reachable(self.start, self.end))
     
     def _find_all_solutions(self):
+        # La pila guarda el camino actual; next_move[i] es la siguiente
+        # dirección a probar desde la celda en la profundidad i
         stack = Stack()
-        stack.push(self.start[0], self.start[1])
-        visited = {self.start}
-        path = [self.start]
+        instr = self.instrumentation
+        checkpointer = self.checkpointer
+        steps = 0
+        if self.timer.started_ns is None:
+            self.timer.start()
+        
+        if self._resume is not None:
+            path, next_move = self._resume
+            self._resume = None
+            for x, y in path:
+                stack.push(x, y)
+                if self.render and self.maze[x][y] not in ['0', 'X']:
+                    self.maze[x][y] = 'o'
+            visited = set(path)
+        else:
+            stack.push(self.start[0], self.start[1])
+            visited = {self.start}
+            path = [self.start]
+            next_move = [0]
+            if instr is not None:
+                instr.push(self.start[0], self.start[1], 1)
+        self._move_to(path[-1][0], path[-1][1], visited)
         
         while stack.size > 0:
-            x, y = stack.pop() or (0, 0)
-            self._move_to(x, y, visited)
+            if checkpointer is not None:
+                # Al dibujar cada paso tarda al menos delay, así que se mira el
+                # reloj en todos; sin dibujo basta cada CHECK_EVERY pasos
+                steps += 1
+                if ((self.render or steps % checkpointer.CHECK_EVERY == 0 or
+                        checkpointer.stop_requested) and checkpointer.due()):
+                    checkpointer.save(self, path, next_move)
+                    if checkpointer.stop_requested:
+                        self.interrupted = True
+                        return
+            
+            x, y = stack.peek()
             
             if (x, y) == self.end:
-                solution_time = time.time() - self.start_time
-                self.solutions.append(Solution(
-                    path=path.copy(),
-                    time_found=solution_time,
-                    length=len(path)
-                ))
-                if len(path) > 1:
-                    path.pop()
-                    visited.remove((x, y))
+                solution_time = self.timer.compute_seconds()
+                self.solutions.add(path, solution_time)
+                if instr is not None:
+                    instr.solution(len(path))
+                self._backtrack(stack, path, next_move, visited, False)
                 continue
             
-            neighbors = []
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                nx, ny = x + dx, y + dy
-                if self._is_valid_move(nx, ny, visited):
-                    neighbors.append((nx, ny))
-            
-            if not neighbors:
-                if len(path) > 1:
-                    path.pop()
-                    if (x, y) not in [self.start, self.end]:
-                        visited.remove((x, y))
+            move = next_move[-1]
+            if move == len(MOVES):
+                self._backtrack(stack, path, next_move, visited, True)
                 continue
+            next_move[-1] = move + 1
             
-            for nx, ny in neighbors:
+            dx, dy = MOVES[move]
+            nx, ny = x + dx, y + dy
+            if self._is_valid_move(nx, ny, visited):
                 stack.push(nx, ny)
                 visited.add((nx, ny))
                 path.append((nx, ny))
+                next_move.append(0)
+                if instr is not None:
+                    instr.push(nx, ny, stack.size)
+                self._move_to(nx, ny, visited)
+            elif instr is not None:
+                instr.reject(nx, ny, self._rejection_reason(nx, ny))
     
-    def _print_final_statistics(self):
+    def _backtrack(self, stack, path, next_move, visited, dead_end):
+        if self.instrumentation is not None:
+            x, y = path[-1]
+            self.instrumentation.pop(x, y, stack.size, dead_end)
+        stack.pop()
+        visited.remove(path.pop())
+        next_move.pop()
+        if stack.size > 0:
+            self._move_to(*stack.peek(), visited)
+    
+    def _summary(self):
         if not self.solutions:
+            return {'count': 0}
+        summary = {
+            'count': len(self.solutions),
+            'shortest': self.solutions.shortest(),
+            'longest': self.solutions.longest(),
+            'average_time': self.solutions.average_time(),
+            'compute_time': self.timer.compute_seconds(),
+            'render_time': self.timer.render_seconds(),
+        }
+        if hasattr(self.solutions, 'shortest_k'):
+            summary['shortest_k'] = self.solutions.shortest_k()
+            summary['longest_k'] = self.solutions.longest_k()
+        return summary
+    
+    def _print_final_statistics(self, summary=None):
+        if summary is None:
+            summary = self._summary()
+        if not summary['count']:
             print("\nNo se encontraron soluciones.")
             return
         
-        shortest = min(self.solutions, key=lambda x: x.length)
-        longest = max(self.solutions, key=lambda x: x.length)
-        avg_time = sum(sol.time_found for sol in self.solutions) / len(self.solutions)
+        shortest = summary['shortest']
+        longest = summary['longest']
+        avg_time = summary['average_time']
         
         print("\nEstadísticas finales:")
-        print(f"Número total de soluciones encontradas: {len(self.solutions)}")
+        print(f"Número total de soluciones encontradas: {summary['count']}")
         
         print("\nSolución más corta:")
         print(f"Longitud: {shortest.length} pasos")
@@ -199,12 +745,23 @@ class MazeSolver:
         print(f"Tiempo: {longest.time_found:.3f} segundos")
         self._print_solution(longest.path)
         
+        if 'shortest_k' in summary:
+            self._print_ranking("Soluciones más cortas", summary['shortest_k'])
+            self._print_ranking("Soluciones más largas", summary['longest_k'])
+        
         print(f"\nTiempo promedio para encontrar solución: {avg_time:.3f} segundos")
+        print(f"Tiempo de búsqueda: {summary['compute_time']:.3f} segundos")
+        print(f"Tiempo de dibujo y espera: {summary['render_time']:.3f} segundos")
+    
+    def _print_ranking(self, title, solutions):
+        print(f"\n{title} ({len(solutions)}):")
+        for i, sol in enumerate(solutions, 1):
+            print(f"{i:>3}. {sol.length} pasos ({sol.time_found:.3f} segundos)")
     
     def _print_solution(self, path):
         solution_maze = [[cell for cell in row] for row in self.maze]
         for x, y in path:
-            if (x, y) not in [self.start, self.end]:
+            if solution_maze[x][y] not in ['0', 'X']:
                 solution_maze[x][y] = 'o'
         
         print("+" + "-" * (self.size * 3) + "+")
@@ -215,7 +772,68 @@ class MazeSolver:
             print("|")
         print("+" + "-" * (self.size * 3) + "+")
 
+def _write_instrumentation(instrumentation, path):
+    # El resumen ya lo muestra solve(); aquí sólo se guarda el JSON si se pidió
+    if instrumentation is None or not path:
+        return
+    with open(path, 'w') as f:
+        f.write(instrumentation.to_json())
+    print(f"Instrumentación guardada en {path}")
+
 def main():
+    parser = argparse.ArgumentParser(description="Resuelve un laberinto mostrando la búsqueda")
+    parser.add_argument('--checkpoint', help="archivo donde guardar puntos de control")
+    parser.add_argument('--intervalo', type=float, default=60.0,
+                        help="segundos entre puntos de control")
+    parser.add_argument('--resume', action='store_true',
+                        help="continúa la búsqueda guardada en --checkpoint")
+    parser.add_argument('--cache', help="directorio de la caché de resultados")
+    parser.add_argument('--cache-mb', type=int, default=256,
+                        help="tamaño máximo de la caché en MB")
+    parser.add_argument('--podar', action='store_true',
+                        help="tapia los callejones sin salida antes de resolver")
+    parser.add_argument('--k', type=int,
+                        help="muestra las k rutas simples más cortas (Yen) en vez de enumerarlas todas")
+    parser.add_argument('--top', type=int,
+                        help="conserva sólo las k soluciones más cortas y las k más largas")
+    parser.add_argument('--multiple', action='store_true',
+                        help="con varios '0' y 'X', busca la meta más cercana a cada inicio")
+    parser.add_argument('--instrumentar', nargs='?', const='', metavar='ARCHIVO.json',
+                        help="cuenta los eventos de la búsqueda y, si se indica, los guarda en JSON")
+    args = parser.parse_args()
+    if args.k is not None and args.k < 1:
+        print("Error: --k debe ser al menos 1")
+        return
+    if args.top is not None and args.top < 1:
+        print("Error: --top debe ser al menos 1")
+        return
+    if args.instrumentar is not None and (args.k is not None or args.multiple):
+        print("Error: --instrumentar sólo se aplica a la enumeración de todas las soluciones")
+        return
+    
+    cache = None
+    if args.cache:
+        from laberinto_cache import ResultCache
+        cache = ResultCache(args.cache, args.cache_mb * 1024 * 1024)
+    
+    checkpointer = None
+    if args.checkpoint:
+        checkpointer = Checkpointer(args.checkpoint, args.intervalo)
+    
+    instrumentation = SearchInstrumentation() if args.instrumentar is not None else None
+    
+    if args.resume:
+        if not args.checkpoint or not os.path.exists(args.checkpoint):
+            print("Error: --resume necesita un archivo --checkpoint existente")
+            return
+        state = Checkpointer.load(args.checkpoint)
+        solver = MazeSolver.from_checkpoint(state, instrumentation=instrumentation,
+                                            checkpointer=checkpointer)
+        solver.cache = cache
+        solver.solve()
+        _write_instrumentation(instrumentation, args.instrumentar)
+        return
+    
     size = int(input("Ingrese el tamaño del laberinto (n x n): "))
     print("\nUse los siguientes caracteres:")
     print("0: Posición inicial")
@@ -229,8 +847,23 @@ def main():
         print(f"Error: La cadena debe tener exactamente {size*size} caracteres")
         return
     
-    solver = MazeSolver(size, maze_string, delay)
+    if args.podar:
+        from laberinto_poda import fill_dead_ends
+        reduced, removed, passes = fill_dead_ends(GridMaze(size, maze_string))
+        maze_string = reduced.cells.decode('latin-1')
+        print(f"Poda: {removed} celdas de callejones tapiadas en {passes} pasadas")
+    
+    solutions = TopKSolutions(args.top) if args.top is not None else None
+    solver = MazeSolver(size, maze_string, delay, solutions=solutions,
+                        instrumentation=instrumentation, checkpointer=checkpointer, cache=cache)
+    if args.multiple:
+        solver.solve_nearest()
+        return
+    if args.k is not None:
+        solver.solve_k_shortest(args.k)
+        return
     solver.solve()
+    _write_instrumentation(instrumentation, args.instrumentar)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
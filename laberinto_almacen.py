@@ -0,0 +1,285 @@
+import bisect
+import heapq
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+
+from laberinto import CompactPath, Solution
+
+RECORD = struct.Struct('<dII')
+
+
+# Almacén de soluciones que pasa a disco: mientras haya pocas soluciones se
+# guardan en memoria; al superar memory_limit se escriben como registros
+# compactos (tiempo, celda inicial, número de movimientos, movimientos de 2 bits)
+# al final de un archivo que se lee con mmap. Un índice por longitud (y, si se
+# pide, un índice invertido por celda) evita recorrer todo el archivo.
+# El índice por celda tampoco crece en memoria: las entradas (celda << 32 | id)
+# se acumulan hasta index_memory_limit y se escriben ordenadas como un tramo
+# al final del archivo de índice; cada consulta busca por bisección en cada
+# tramo y, cuando hay más de MAX_RUNS, se fusionan en uno solo.
+# El archivo de índice nunca se reescribe: la fusión crea una generación nueva
+# (path + '.idx.N') y la generación que guardó el último punto de control se
+# conserva hasta el siguiente, así que reanudar siempre encuentra sus tramos.
+class SpillingSolutionStore:
+    MAX_RUNS = 32
+
+    def __init__(self, size, memory_limit=100000, path=None, index_cells=False,
+                 index_memory_limit=1 << 20):
+        self.size = size
+        self.memory_limit = memory_limit
+        self._delete = path is None
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix='soluciones_', suffix='.bin')
+            os.close(fd)
+        self.path = path
+        self._file = open(path, 'w+b')
+        self._map = None
+        self._memory = []
+        self.offsets = array('q')
+        self.spilled = False
+        self.total_time = 0.0
+        self.by_length = {}
+        self.index_cells = index_cells
+        self.index_memory_limit = index_memory_limit
+        self._postings = array('Q')
+        self._runs = []
+        self.index_generation = 0
+        self._pinned_generation = None
+        self._index_file = open(self._index_path(0), 'w+b') if index_cells else None
+        self._index_map = None
+        self.index_bytes = 0
+        self.bytes_written = 0
+
+    def add(self, path, time_found):
+        solution = Solution(CompactPath.from_cells(path), time_found, len(path))
+        self._index(len(self), solution)
+        self.total_time += time_found
+        if self.spilled:
+            self._write(solution)
+        else:
+            self._memory.append(solution)
+            if len(self._memory) > self.memory_limit:
+                self._spill()
+
+    def _index(self, i, solution):
+        self.by_length.setdefault(solution.length, array('I')).append(i)
+        if self.index_cells:
+            size = self.size
+            postings = self._postings
+            for x, y in solution.path:
+                postings.append((x * size + y) << 32 | i)
+            if len(postings) >= self.index_memory_limit:
+                self._flush_postings()
+
+    def _index_path(self, generation):
+        return f"{self.path}.idx.{generation}"
+
+    def _remove_generation(self, generation):
+        if generation is not None and os.path.exists(self._index_path(generation)):
+            os.remove(self._index_path(generation))
+
+    def _flush_postings(self):
+        if not self._postings:
+            return
+        run = array('Q', sorted(self._postings))
+        self._append_run(run)
+        self._postings = array('Q')
+        if len(self._runs) > self.MAX_RUNS:
+            self._merge_runs()
+
+    def _append_run(self, run):
+        self._index_file.seek(self.index_bytes)
+        self._index_file.write(run.tobytes())
+        self._runs.append((self.index_bytes // run.itemsize, len(run)))
+        self.index_bytes += len(run) * run.itemsize
+
+    def _index_view(self):
+        if self._index_map is None or len(self._index_map) < self.index_bytes:
+            self._index_file.flush()
+            self._close_index_map()
+            self._index_map = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(self._index_map).cast('Q')
+
+    def _close_index_map(self):
+        if self._index_map is not None:
+            self._index_map.close()
+            self._index_map = None
+
+    def _merge_runs(self):
+        # Fusión en streaming: los tramos ya están ordenados y nunca se
+        # cargan enteros en memoria
+        view = self._index_view()
+        runs = [view[start:start + count] for start, count in self._runs]
+        generation = self.index_generation + 1
+        total = 0
+        with open(self._index_path(generation), 'wb') as f:
+            chunk = array('Q')
+            for key in heapq.merge(*runs):
+                chunk.append(key)
+                if len(chunk) >= self.index_memory_limit:
+                    f.write(chunk.tobytes())
+                    total += len(chunk)
+                    chunk = array('Q')
+            f.write(chunk.tobytes())
+            total += len(chunk)
+        for run in runs:
+            run.release()
+        view.release()
+        self._switch_generation(generation)
+        self._runs = [(0, total)]
+        self.index_bytes = total * 8
+
+    def _switch_generation(self, generation):
+        self._close_index_map()
+        self._index_file.close()
+        if self.index_generation != self._pinned_generation:
+            self._remove_generation(self.index_generation)
+        self.index_generation = generation
+        self._index_file = open(self._index_path(generation), 'r+b')
+
+    def _rebuild_index(self):
+        # El archivo del punto de control no coincide con los tramos guardados:
+        # se vuelve a indexar desde los registros de soluciones
+        generation = self.index_generation + 1
+        open(self._index_path(generation), 'wb').close()
+        self._switch_generation(generation)
+        self._runs = []
+        self.index_bytes = 0
+        self._postings = array('Q')
+        size = self.size
+        for i, solution in enumerate(self):
+            for x, y in solution.path:
+                self._postings.append((x * size + y) << 32 | i)
+            if len(self._postings) >= self.index_memory_limit:
+                self._flush_postings()
+
+    def _spill(self):
+        self.spilled = True
+        for solution in self._memory:
+            self._write(solution)
+        self._memory = []
+
+    def _write(self, solution):
+        path = solution.path
+        x, y = path.start
+        self.offsets.append(self._file.tell())
+        record = RECORD.pack(solution.time_found, x * self.size + y, path.count) + path.moves
+        self._file.write(record)
+        self.bytes_written += len(record)
+
+    def _read(self, i):
+        offset = self.offsets[i]
+        if self._map is None or len(self._map) < self.bytes_written:
+            self._file.flush()
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        time_found, start, count = RECORD.unpack_from(self._map, offset)
+        begin = offset + RECORD.size
+        moves = self._map[begin:begin + (count + 3) // 4]
+        path = CompactPath(divmod(start, self.size), moves, count)
+        return Solution(path, time_found, count + 1)
+
+    def __len__(self):
+        return len(self.offsets) if self.spilled else len(self._memory)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return self._read(i) if self.spilled else self._memory[i]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def of_length(self, length):
+        for i in self.by_length.get(length, ()):
+            yield self[i]
+
+    def through(self, x, y):
+        if not self.index_cells:
+            raise ValueError("El almacén se creó sin índice por celda (index_cells=False)")
+        low = (x * self.size + y) << 32
+        high = low + (1 << 32)
+        ids = array('I')
+        if self._runs:
+            view = self._index_view()
+            for start, count in self._runs:
+                first = bisect.bisect_left(view, low, start, start + count)
+                last = bisect.bisect_left(view, high, first, start + count)
+                ids.extend(key & 0xFFFFFFFF for key in view[first:last])
+            view.release()
+        # Los tramos son cronológicos y el búfer es lo más reciente, así que
+        # los identificadores salen en orden creciente
+        ids.extend(key & 0xFFFFFFFF for key in self._postings if low <= key < high)
+        for i in ids:
+            yield self[i]
+
+    def shortest(self):
+        return self[self.by_length[min(self.by_length)][0]]
+
+    def longest(self):
+        return self[self.by_length[max(self.by_length)][0]]
+
+    def average_time(self):
+        return self.total_time / len(self)
+
+    def __getstate__(self):
+        # Para los puntos de control: el archivo se conserva y se reabre
+        self._file.flush()
+        if self._index_file is not None:
+            self._index_file.flush()
+            # La generación anterior sólo la necesitaba el punto de control previo
+            previous = self._pinned_generation
+            self._pinned_generation = self.index_generation
+            if previous != self.index_generation:
+                self._remove_generation(previous)
+        state = self.__dict__.copy()
+        state['_file'] = None
+        state['_map'] = None
+        state['_index_file'] = None
+        state['_index_map'] = None
+        state['_delete'] = False
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._file = open(self.path, 'r+b')
+        self._file.truncate(self.bytes_written)
+        self._file.seek(0, os.SEEK_END)
+        if self.index_cells:
+            self._pinned_generation = self.index_generation
+            index_path = self._index_path(self.index_generation)
+            expected = sum(count for _, count in self._runs) * 8
+            if (expected != self.index_bytes or not os.path.exists(index_path) or
+                    os.path.getsize(index_path) < self.index_bytes):
+                self._index_file = open(index_path, 'a+b')
+                self._rebuild_index()
+            else:
+                self._index_file = open(index_path, 'r+b')
+                self._index_file.truncate(self.index_bytes)
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+        if self._index_file is not None:
+            self._close_index_map()
+            self._index_file.close()
+        if self._delete:
+            os.remove(self.path)
+            if self.index_cells:
+                self._remove_generation(self.index_generation)
+                self._remove_generation(self._pinned_generation)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
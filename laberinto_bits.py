@@ -0,0 +1,105 @@
+import sys
+
+from laberinto_busqueda import WALL, GridMaze
+
+# Tabla para bytes.translate: pared -> '0', cualquier otra celda -> '1'
+_FREE_DIGITS = bytes(ord('0') if c == WALL else ord('1') for c in range(256))
+
+
+# Tablero de bits: todo el laberinto cabe en un único entero de Python, con el
+# bit x * size + y encendido si la celda (x, y) está libre. Un paso de la
+# inundación desplaza el conjunto alcanzado en las cuatro direcciones a la vez;
+# las máscaras de borde de fila evitan que un desplazamiento horizontal pase
+# de la última columna de una fila a la primera de la siguiente.
+class BitMaze:
+    def __init__(self, grid):
+        size = self.size = grid.size
+        total = size * size
+        # El bit 0 es la celda (0, 0), así que la cadena binaria va al revés
+        self.free = int(grid.cells.translate(_FREE_DIGITS)[::-1] or b'0', 2)
+        first_column = int(('0' * (size - 1) + '1') * size or '0', 2)
+        full = (1 << total) - 1
+        self.not_first_column = full ^ first_column
+        self.not_last_column = full ^ (first_column << (size - 1))
+
+    def bit(self, x, y):
+        return 1 << (x * self.size + y)
+
+    def step(self, reach):
+        # Un anillo de la BFS: vecinas libres de todas las celdas de reach
+        size = self.size
+        grown = (reach | ((reach << 1) & self.not_first_column) |
+                 ((reach >> 1) & self.not_last_column) |
+                 (reach << size) | (reach >> size))
+        return grown & self.free
+
+    def flood(self, seeds, target=0):
+        # Conjunto alcanzable desde seeds; si target toca el conjunto se
+        # devuelve en cuanto ocurre, sin terminar de inundar
+        reach = seeds & self.free
+        while not reach & target:
+            grown = self.step(reach)
+            if grown == reach:
+                break
+            reach = grown
+        return reach
+
+    def reachable(self, a, b):
+        if not all(0 <= c < self.size for c in a + b):
+            return False
+        target = self.bit(*b)
+        return bool(target & self.free) and bool(self.flood(self.bit(*a), target) & target)
+
+    def components(self):
+        # Regiones conexas como máscaras, empezando por la del bit libre más bajo
+        remaining = self.free
+        while remaining:
+            region = self.flood(remaining & -remaining)
+            yield region
+            remaining &= ~region
+
+    def region_sizes(self):
+        return [region.bit_count() for region in self.components()]
+
+    def cells(self, mask):
+        # Se recorre la cadena binaria una vez; quitar el bit más bajo en
+        # cada paso costaría O(celdas) por celda en tableros grandes
+        digits = format(mask, 'b')[::-1]
+        index = digits.find('1')
+        while index != -1:
+            yield divmod(index, self.size)
+            index = digits.find('1', index + 1)
+
+
+def main():
+    if len(sys.argv) < 3:
+        print("Uso: python laberinto_bits.py <archivo.txt> <tamaño>")
+        return
+    import time
+    from laberinto_busqueda import bfs
+
+    source, size = sys.argv[1], int(sys.argv[2])
+    with open(source) as f:
+        maze_string = ''.join(line.rstrip('\r\n') for line in f)
+    if len(maze_string) != size * size:
+        print(f"Error: La cadena debe tener exactamente {size*size} caracteres")
+        return
+    grid = GridMaze(size, maze_string)
+    start, end = grid.find('0'), grid.find('X')
+
+    started = time.perf_counter()
+    board = BitMaze(grid)
+    reachable = board.reachable(start, end)
+    bits_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    expected = bfs(grid, start, end) is not None
+    bfs_seconds = time.perf_counter() - started
+    assert reachable == expected
+    sizes = board.region_sizes()
+    print(f"'X' {'es' if reachable else 'no es'} alcanzable desde '0'")
+    print(f"{len(sizes)} regiones conexas; la mayor tiene {max(sizes, default=0)} celdas")
+    print(f"Tablero de bits: {bits_seconds:.4f} segundos, BFS: {bfs_seconds:.4f} segundos")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+import heapq
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from collections import OrderedDict, deque
+
+from laberinto_busqueda import MOVES, WALL, manhattan
+
+MAGIC = b'LABT'
+HEADER = struct.Struct('<4sIIiiii')
+
+
+# Laberinto fuera de memoria: la cuadrícula se guarda en un archivo por bloques
+# (tiles) de tile_size x tile_size bytes y sólo se cargan los bloques que se usan.
+# El estado de la búsqueda tampoco vive en RAM: bfs y astar de este módulo
+# guardan padres y costes en archivos temporales mapeados (CellStore); sólo la
+# frontera (cola o montículo) y el camino final quedan en memoria.
+class TiledMaze:
+    def __init__(self, path, memory_budget=64 * 1024 * 1024):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, size, tile_size, sx, sy, ex, ey = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} no es un laberinto por bloques")
+        self.size = size
+        self.tile_size = tile_size
+        self.tiles_per_side = -(-size // tile_size)
+        self.start = (sx, sy)
+        self.end = (ex, ey)
+        self.max_tiles = max(1, memory_budget // (tile_size * tile_size))
+        self._tiles = OrderedDict()
+        self._last_key = -1
+        self._last_tile = None
+        self.hits = 0
+        self.misses = 0
+        self.bytes_read = 0
+
+    @classmethod
+    def create(cls, path, size, rows, tile_size=256, **kwargs):
+        # rows es cualquier iterable de filas (p. ej. las líneas de un archivo),
+        # así nunca se necesita la cuadrícula completa en memoria
+        tps = -(-size // tile_size)
+        start = end = (-1, -1)
+        band = []
+        try:
+            with open(path, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, size, tile_size, -1, -1, -1, -1))
+                count = 0
+                for i, row in enumerate(rows):
+                    count = i + 1
+                    row = row.rstrip('\r\n')
+                    if len(row) != size:
+                        raise ValueError(f"La fila {i} debe tener exactamente {size} caracteres")
+                    if start == (-1, -1) and '0' in row:
+                        start = (i, row.index('0'))
+                    if end == (-1, -1) and 'X' in row:
+                        end = (i, row.index('X'))
+                    band.append(row.encode('latin-1'))
+                    if len(band) == tile_size:
+                        cls._write_band(f, band, size, tile_size, tps)
+                        band = []
+                if count != size:
+                    raise ValueError(f"El laberinto tiene {count} filas; se esperaban {size}")
+                if band:
+                    cls._write_band(f, band, size, tile_size, tps)
+                f.seek(0)
+                f.write(HEADER.pack(MAGIC, size, tile_size, *start, *end))
+        except ValueError:
+            # Un archivo a medio escribir parecería un laberinto válido
+            os.remove(path)
+            raise
+        return cls(path, **kwargs)
+
+    @classmethod
+    def from_string(cls, path, size, maze_string, tile_size=256, **kwargs):
+        rows = (maze_string[i:i+size] for i in range(0, len(maze_string), size))
+        return cls.create(path, size, rows, tile_size, **kwargs)
+
+    @staticmethod
+    def _write_band(f, band, size, tile_size, tps):
+        padding = bytes([WALL]) * (tps * tile_size - size)
+        band = [row + padding for row in band]
+        band += [bytes([WALL]) * (tps * tile_size)] * (tile_size - len(band))
+        for tc in range(tps):
+            lo = tc * tile_size
+            f.write(b''.join(row[lo:lo + tile_size] for row in band))
+
+    def _tile(self, tr, tc):
+        key = tr * self.tiles_per_side + tc
+        if key == self._last_key:
+            self.hits += 1
+            return self._last_tile
+        tile = self._tiles.get(key)
+        if tile is None:
+            self.misses += 1
+            area = self.tile_size * self.tile_size
+            offset = HEADER.size + key * area
+            tile = self._map[offset:offset + area]
+            self.bytes_read += area
+            self._tiles[key] = tile
+            if len(self._tiles) > self.max_tiles:
+                self._tiles.popitem(last=False)
+        else:
+            self.hits += 1
+            self._tiles.move_to_end(key)
+        self._last_key = key
+        self._last_tile = tile
+        return tile
+
+    def is_open(self, x, y):
+        if not (0 <= x < self.size and 0 <= y < self.size):
+            return False
+        t = self.tile_size
+        return self._tile(x // t, y // t)[(x % t) * t + y % t] != WALL
+
+    def find(self, char):
+        if char == '0':
+            return self.start
+        if char == 'X':
+            return self.end
+        raise ValueError("Sólo se indexan las posiciones '0' y 'X'")
+
+    def cache_stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'bytes_read': self.bytes_read,
+            'resident_tiles': len(self._tiles),
+            'max_tiles': self.max_tiles,
+        }
+
+    def close(self):
+        self._tiles.clear()
+        self._last_tile = None
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# Array por celda respaldado por un archivo temporal disperso: el sistema
+# operativo sólo reserva las páginas que se tocan y puede devolverlas al disco.
+# El valor 0 significa 'sin visitar', así que no hace falta inicializarlo.
+class CellStore:
+    def __init__(self, count, typecode='B', directory=None):
+        self._file = tempfile.TemporaryFile(dir=directory)
+        itemsize = struct.calcsize(typecode)
+        self._file.truncate(max(1, count * itemsize))
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self._view = memoryview(self._map).cast(typecode)
+
+    def __getitem__(self, index):
+        return self._view[index]
+
+    def __setitem__(self, index, value):
+        self._view[index] = value
+
+    def close(self):
+        self._view.release()
+        self._map.close()
+        self._file.close()
+
+
+def _trace(parents, size, start, end):
+    # parents guarda el código de MOVES + 1 con el que se llegó a cada celda
+    path = [end]
+    x, y = end
+    while (x, y) != start:
+        dx, dy = MOVES[parents[x * size + y] - 1]
+        x, y = x - dx, y - dy
+        path.append((x, y))
+    path.reverse()
+    return path
+
+
+def bfs(maze, start, end, counters=None):
+    # BFS con un byte por celda en disco en lugar de un dict de tuplas
+    size = maze.size
+    parents = CellStore(size * size, 'B', os.path.dirname(os.path.abspath(maze.path)))
+    try:
+        queue = deque([start])
+        parents[start[0] * size + start[1]] = len(MOVES) + 1
+        expanded = 0
+        found = False
+        while queue:
+            x, y = queue.popleft()
+            expanded += 1
+            if (x, y) == end:
+                found = True
+                break
+            for code, (dx, dy) in enumerate(MOVES):
+                nx, ny = x + dx, y + dy
+                if maze.is_open(nx, ny) and not parents[nx * size + ny]:
+                    parents[nx * size + ny] = code + 1
+                    queue.append((nx, ny))
+        if counters is not None:
+            counters['expanded'] = counters.get('expanded', 0) + expanded
+        return _trace(parents, size, start, end) if found else None
+    finally:
+        parents.close()
+
+
+def astar(maze, start, end, counters=None, heuristic=manhattan):
+    # A* con padres (un byte) y costes g + 1 (cuatro bytes) por celda en disco
+    size = maze.size
+    directory = os.path.dirname(os.path.abspath(maze.path))
+    parents = CellStore(size * size, 'B', directory)
+    costs = CellStore(size * size, 'i', directory)
+    try:
+        parents[start[0] * size + start[1]] = len(MOVES) + 1
+        costs[start[0] * size + start[1]] = 1
+        heap = [(heuristic(start, end), 0, start)]
+        expanded = 0
+        found = False
+        while heap:
+            _, g, cell = heapq.heappop(heap)
+            x, y = cell
+            if g + 1 > costs[x * size + y]:
+                continue
+            expanded += 1
+            if cell == end:
+                found = True
+                break
+            ng = g + 1
+            for code, (dx, dy) in enumerate(MOVES):
+                nx, ny = x + dx, y + dy
+                index = nx * size + ny
+                if maze.is_open(nx, ny) and (not costs[index] or ng + 1 < costs[index]):
+                    costs[index] = ng + 1
+                    parents[index] = code + 1
+                    heapq.heappush(heap, (ng + heuristic((nx, ny), end), ng, (nx, ny)))
+        if counters is not None:
+            counters['expanded'] = counters.get('expanded', 0) + expanded
+        return _trace(parents, size, start, end) if found else None
+    finally:
+        parents.close()
+        costs.close()
+
+
+def main():
+    if len(sys.argv) < 4:
+        print("Uso: python laberinto_bloques.py <archivo.txt> <tamaño> <archivo.lab> "
+              "[tamaño_bloque] [memoria_MB]")
+        return
+    source, size, target = sys.argv[1], int(sys.argv[2]), sys.argv[3]
+    tile_size = int(sys.argv[4]) if len(sys.argv) > 4 else 256
+    budget = int(sys.argv[5]) * 1024 * 1024 if len(sys.argv) > 5 else 64 * 1024 * 1024
+
+    with open(source) as rows:
+        maze = TiledMaze.create(target, size, rows, tile_size, memory_budget=budget)
+    with maze:
+        if maze.start == (-1, -1) or maze.end == (-1, -1):
+            print("El laberinto no es válido o no tiene solución posible.")
+            return
+        for name, engine in (('BFS', bfs), ('A*', astar)):
+            counters = {}
+            path = engine(maze, maze.start, maze.end, counters)
+            stats = maze.cache_stats()
+            print(f"\n{name}:")
+            if path is None:
+                print("No se encontraron soluciones.")
+            else:
+                print(f"Longitud: {len(path)} pasos")
+            print(f"Nodos expandidos: {counters['expanded']}")
+            print(f"Aciertos de caché: {stats['hit_rate']:.1%} "
+                  f"({stats['misses']} bloques cargados, {stats['bytes_read']} bytes leídos)")
+
+
+if __name__ == "__main__":
+    main()
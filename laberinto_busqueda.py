@@ -0,0 +1,168 @@
+import heapq
+from array import array
+from collections import deque
+
+WALL = ord('+')
+MOVES = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+
+
+# Laberinto en una cuadrícula plana: un byte por celda, indexado por fila
+class GridMaze:
+    def __init__(self, size, maze_string):
+        self.size = size
+        self.cells = bytearray(maze_string.encode('latin-1'))
+
+    def is_open(self, x, y):
+        return (0 <= x < self.size and
+                0 <= y < self.size and
+                self.cells[x * self.size + y] != WALL)
+
+    def find(self, char):
+        index = self.cells.find(ord(char))
+        if index == -1:
+            return (-1, -1)
+        return divmod(index, self.size)
+
+
+def manhattan(a, b):
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+def _build_path(parents, end):
+    path = [end]
+    cell = parents[end]
+    while cell is not None:
+        path.append(cell)
+        cell = parents[cell]
+    path.reverse()
+    return path
+
+
+NOTHING = frozenset()
+
+
+def bfs(grid, start, end, counters=None, blocked=NOTHING, blocked_edges=NOTHING):
+    # Búsqueda en anchura; devuelve el camino más corto o None.
+    # blocked y blocked_edges excluyen celdas y movimientos (usado por Yen)
+    parents = {start: None}
+    queue = deque([start])
+    restricted = bool(blocked or blocked_edges)
+    expanded = 0
+    found = False
+
+    while queue:
+        x, y = queue.popleft()
+        expanded += 1
+        if (x, y) == end:
+            found = True
+            break
+        for dx, dy in MOVES:
+            nx, ny = x + dx, y + dy
+            if (nx, ny) not in parents and grid.is_open(nx, ny):
+                if restricted and ((nx, ny) in blocked or ((x, y), (nx, ny)) in blocked_edges):
+                    continue
+                parents[(nx, ny)] = (x, y)
+                queue.append((nx, ny))
+
+    if counters is not None:
+        counters['expanded'] = counters.get('expanded', 0) + expanded
+    return _build_path(parents, end) if found else None
+
+
+def astar(grid, start, end, counters=None, heuristic=manhattan,
+          blocked=NOTHING, blocked_edges=NOTHING):
+    # A* con distancia Manhattan (admisible en una cuadrícula 4-conexa)
+    parents = {start: None}
+    costs = {start: 0}
+    heap = [(heuristic(start, end), 0, start)]
+    restricted = bool(blocked or blocked_edges)
+    expanded = 0
+    found = False
+
+    while heap:
+        _, g, cell = heapq.heappop(heap)
+        if g > costs[cell]:
+            continue
+        expanded += 1
+        if cell == end:
+            found = True
+            break
+        x, y = cell
+        for dx, dy in MOVES:
+            nxt = (x + dx, y + dy)
+            ng = g + 1
+            if ng < costs.get(nxt, ng + 1) and grid.is_open(nxt[0], nxt[1]):
+                if restricted and (nxt in blocked or (cell, nxt) in blocked_edges):
+                    continue
+                costs[nxt] = ng
+                parents[nxt] = cell
+                heapq.heappush(heap, (ng + heuristic(nxt, end), ng, nxt))
+
+    if counters is not None:
+        counters['expanded'] = counters.get('expanded', 0) + expanded
+    return _build_path(parents, end) if found else None
+
+
+def k_shortest_paths(grid, start, end, k, engine=bfs, counters=None):
+    # Algoritmo de Yen: genera los k caminos simples más cortos en orden de
+    # longitud no decreciente, entregando cada uno en cuanto es definitivo
+    if k < 1:
+        return
+    first = engine(grid, start, end, counters)
+    if first is None:
+        return
+    yield first
+
+    found = [first]
+    deviations = [0]
+    seen = {tuple(first)}
+    candidates = []
+    pushed = 0
+
+    while len(found) < k:
+        prev = found[-1]
+        deviation = deviations[-1]
+        # Los caminos que comparten la raíz prev[:i+1] se filtran de forma
+        # incremental en vez de comparar cada prefijo completo
+        matching = [p for p in found if p[:deviation + 1] == prev[:deviation + 1]]
+        blocked = set(prev[:deviation])
+        for i in range(deviation, len(prev) - 1):
+            if i > deviation:
+                matching = [p for p in matching if len(p) > i and p[i] == prev[i]]
+                blocked.add(prev[i - 1])
+            spur = prev[i]
+            blocked_edges = {(p[i], p[i + 1]) for p in matching if len(p) > i + 1}
+            spur_path = engine(grid, spur, end, counters,
+                               blocked=blocked, blocked_edges=blocked_edges)
+            if spur_path is None:
+                continue
+            path = prev[:i] + spur_path
+            key = tuple(path)
+            if key not in seen:
+                seen.add(key)
+                heapq.heappush(candidates, (len(path), pushed, i, path))
+                pushed += 1
+
+        if not candidates:
+            return
+        _, _, deviation, path = heapq.heappop(candidates)
+        found.append(path)
+        deviations.append(deviation)
+        yield path
+
+
+def bfs_distances(grid, source):
+    # Distancias BFS desde source a todas las celdas (-1 si no se alcanzan)
+    size = grid.size
+    distances = array('i', [-1]) * (size * size)
+    distances[source[0] * size + source[1]] = 0
+    queue = deque([source])
+    while queue:
+        x, y = queue.popleft()
+        step = distances[x * size + y] + 1
+        for dx, dy in MOVES:
+            nx, ny = x + dx, y + dy
+            if grid.is_open(nx, ny) and distances[nx * size + ny] == -1:
+                distances[nx * size + ny] = step
+                queue.append((nx, ny))
+    return distances
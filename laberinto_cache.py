@@ -0,0 +1,139 @@
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import zlib
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from laberinto import CompactPath, Solution
+from laberinto_simetria import canonicalize, transform_summary
+
+SUFFIX = '.res'
+
+
+def _encode_solution(solution):
+    path = solution.path
+    if not isinstance(path, CompactPath):
+        path = CompactPath.from_cells(list(path))
+    return [path.start[0], path.start[1], path.count,
+            base64.b64encode(path.moves).decode('ascii'),
+            solution.time_found]
+
+
+def _decode_solution(data):
+    x, y, count, moves, time_found = data
+    path = CompactPath((x, y), base64.b64decode(moves), count)
+    return Solution(path, time_found, count + 1)
+
+
+def encode_summary(summary):
+    data = {}
+    for name, value in summary.items():
+        if isinstance(value, Solution):
+            value = _encode_solution(value)
+        elif isinstance(value, list):
+            value = [_encode_solution(sol) for sol in value]
+        data[name] = value
+    return zlib.compress(json.dumps(data, separators=(',', ':')).encode('utf-8'))
+
+
+def decode_summary(blob):
+    data = json.loads(zlib.decompress(blob))
+    for name in ('shortest', 'longest'):
+        if name in data:
+            data[name] = _decode_solution(data[name])
+    for name in ('shortest_k', 'longest_k'):
+        if name in data:
+            data[name] = [_decode_solution(sol) for sol in data[name]]
+    return data
+
+
+# Caché de resultados direccionada por contenido: la clave es un hash de
+# (laberinto, tamaño, motor, opciones) y cada entrada es un archivo con el
+# resumen comprimido. La fecha de modificación hace de marca LRU y las
+# escrituras son atómicas (archivo temporal + os.replace), así que varios
+# procesos pueden compartir el mismo directorio. Con canonical=True las
+# rotaciones y reflejos de un laberinto comparten la misma entrada.
+class ResultCache:
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024, canonical=True):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.canonical = canonical
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(maze_string, size, engine, options=None):
+        payload = json.dumps([maze_string, size, engine, options or {}], sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _canonical(self, maze_string, size):
+        if not self.canonical:
+            return maze_string, 0
+        return canonicalize(size, maze_string)
+
+    def lookup(self, maze_string, size, engine, options=None):
+        # Los caminos se guardan en coordenadas canónicas y se devuelven en
+        # las del laberinto pedido
+        canonical, t = self._canonical(maze_string, size)
+        summary = self.get(self.key(canonical, size, engine, options))
+        if summary is None:
+            return None
+        return transform_summary(summary, t, size, inverse=True)
+
+    def store(self, maze_string, size, engine, options, summary):
+        canonical, t = self._canonical(maze_string, size)
+        self.put(self.key(canonical, size, engine, options), transform_summary(summary, t, size))
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                summary = decode_summary(f.read())
+            os.utime(path)
+        except (OSError, ValueError, zlib.error):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return summary
+
+    def put(self, key, summary):
+        fd, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(encode_summary(summary))
+        os.replace(temporary, self._path(key))
+        self._evict()
+
+    def _evict(self):
+        with open(os.path.join(self.directory, '.lock'), 'a') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            entries = []
+            total = 0
+            for name in os.listdir(self.directory):
+                if not name.endswith(SUFFIX):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, name))
+                total += stat.st_size
+            entries.sort()
+            for _, size, name in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    pass
+                total -= size
@@ -0,0 +1,97 @@
+from array import array
+
+
+def _spread(value):
+    # Intercala ceros entre los bits: 0b1011 -> 0b1000101
+    result = 0
+    for bit in range(8):
+        result |= ((value >> bit) & 1) << (2 * bit)
+    return result
+
+
+# Tablas de la curva Z (Morton): _SPREAD reparte un byte en los bits pares de
+# 16 bits y _COMPACT deshace un bloque de 16 bits en (fila << 8) | columna
+_SPREAD = array('I', [_spread(v) for v in range(256)])
+_COMPACT = array('I', [0]) * 65536
+for _x in range(256):
+    for _y in range(256):
+        _COMPACT[(_SPREAD[_x] << 1) | _SPREAD[_y]] = (_x << 8) | _y
+del _x, _y
+
+
+def morton_encode(x, y):
+    code = 0
+    shift = 0
+    while x or y:
+        code |= ((_SPREAD[x & 0xFF] << 1) | _SPREAD[y & 0xFF]) << shift
+        x >>= 8
+        y >>= 8
+        shift += 16
+    return code
+
+
+def morton_decode(code):
+    x = y = 0
+    shift = 0
+    while code:
+        packed = _COMPACT[code & 0xFFFF]
+        x |= (packed >> 8) << shift
+        y |= (packed & 0xFF) << shift
+        code >>= 16
+        shift += 8
+    return x, y
+
+
+def _side(size):
+    # Lado de la curva de Hilbert: la menor potencia de dos que cubre size
+    side = 1
+    while side < size:
+        side <<= 1
+    return side
+
+
+def hilbert_encode(size, x, y):
+    # Recorre los niveles del más grueso al más fino girando el cuadrante
+    # en cada paso para que las celdas consecutivas queden siempre contiguas
+    side = _side(size)
+    d = 0
+    s = side >> 1
+    while s:
+        rx = 1 if x & s else 0
+        ry = 1 if y & s else 0
+        d += s * s * ((3 * rx) ^ ry)
+        if not ry:
+            if rx:
+                x = side - 1 - x
+                y = side - 1 - y
+            x, y = y, x
+        s >>= 1
+    return d
+
+
+def hilbert_decode(size, d):
+    side = _side(size)
+    x = y = 0
+    s = 1
+    while s < side:
+        rx = 1 & (d >> 1)
+        ry = 1 & (d ^ rx)
+        if not ry:
+            if rx:
+                x = s - 1 - x
+                y = s - 1 - y
+            x, y = y, x
+        x += s * rx
+        y += s * ry
+        d >>= 2
+        s <<= 1
+    return x, y
+
+
+# Claves de ordenación de celdas para MazeGraph.compile; 'fila' conserva el
+# orden de fila habitual
+ORDERS = {
+    'fila': None,
+    'morton': lambda size, x, y: morton_encode(x, y),
+    'hilbert': hilbert_encode,
+}
@@ -0,0 +1,105 @@
+import heapq
+
+from laberinto_busqueda import MOVES, WALL, GridMaze, manhattan
+
+INFINITY = float('inf')
+FREE = ord(' ')
+
+
+# Lifelong Planning A* (Koenig y Likhachev): mantiene g y rhs de cada celda
+# entre ediciones. Al poner o quitar una pared sólo se actualizan las celdas
+# afectadas y la reparación expande, en general, sólo la zona del cambio.
+class LifelongPlanningAStar:
+    def __init__(self, size, maze_string):
+        self.grid = GridMaze(size, maze_string)
+        self.size = size
+        self.start = self.grid.find('0')
+        self.end = self.grid.find('X')
+        self.g = {}
+        self.rhs = {self.start: 0}
+        self._heap = []
+        self._queued = {}
+        self.expanded = 0
+        self._push(self.start)
+
+    def _key(self, cell):
+        best = min(self.g.get(cell, INFINITY), self.rhs.get(cell, INFINITY))
+        return (best + manhattan(cell, self.end), best)
+
+    def _push(self, cell):
+        key = self._key(cell)
+        self._queued[cell] = key
+        heapq.heappush(self._heap, (key, cell))
+
+    def _neighbors(self, cell):
+        x, y = cell
+        for dx, dy in MOVES:
+            if self.grid.is_open(x + dx, y + dy):
+                yield (x + dx, y + dy)
+
+    def _update(self, cell):
+        if cell != self.start:
+            if self.grid.is_open(*cell):
+                self.rhs[cell] = min((self.g.get(n, INFINITY) + 1 for n in self._neighbors(cell)),
+                                     default=INFINITY)
+            else:
+                self.rhs[cell] = INFINITY
+        self._queued.pop(cell, None)
+        if self.g.get(cell, INFINITY) != self.rhs.get(cell, INFINITY):
+            self._push(cell)
+
+    def _top(self):
+        # Las entradas obsoletas del montículo se descartan de forma perezosa
+        while self._heap:
+            key, cell = self._heap[0]
+            if self._queued.get(cell) == key:
+                return key, cell
+            heapq.heappop(self._heap)
+        return (INFINITY, INFINITY), None
+
+    def _compute(self):
+        while True:
+            key, cell = self._top()
+            end_key = self._key(self.end)
+            if cell is None or (key >= end_key and
+                                self.rhs.get(self.end, INFINITY) == self.g.get(self.end, INFINITY)):
+                return
+            heapq.heappop(self._heap)
+            del self._queued[cell]
+            self.expanded += 1
+            if self.g.get(cell, INFINITY) > self.rhs.get(cell, INFINITY):
+                self.g[cell] = self.rhs[cell]
+                for n in self._neighbors(cell):
+                    self._update(n)
+            else:
+                self.g[cell] = INFINITY
+                self._update(cell)
+                for n in self._neighbors(cell):
+                    self._update(n)
+
+    def shortest_path(self):
+        self._compute()
+        if self.g.get(self.end, INFINITY) == INFINITY:
+            return None
+        path = [self.end]
+        cell = self.end
+        while cell != self.start:
+            cell = min(self._neighbors(cell), key=lambda n: self.g.get(n, INFINITY))
+            path.append(cell)
+        path.reverse()
+        return path
+
+    def _set_cell(self, x, y, value):
+        index = x * self.size + y
+        if (x, y) in (self.start, self.end) or self.grid.cells[index] == value:
+            return
+        self.grid.cells[index] = value
+        self._update((x, y))
+        for n in self._neighbors((x, y)):
+            self._update(n)
+
+    def set_wall(self, x, y):
+        self._set_cell(x, y, WALL)
+
+    def clear_wall(self, x, y):
+        self._set_cell(x, y, FREE)
@@ -0,0 +1,104 @@
+import struct
+import sys
+from array import array
+from collections import deque
+
+from laberinto_busqueda import MOVES, WALL, GridMaze
+
+MAGIC = b'LABD'
+HEADER = struct.Struct('<4sIii')
+NO_MOVE = 255
+
+
+# Campo de distancias a la meta: una sola BFS inversa desde 'X' guarda la
+# distancia de cada celda y la dirección del siguiente paso hacia la meta.
+# Después cualquier inicio se responde en O(1) (distancia) o O(longitud) (camino).
+class GoalDistanceField:
+    def __init__(self, size, goal, distances, directions):
+        self.size = size
+        self.goal = goal
+        self.distances = distances
+        self.directions = directions
+
+    @classmethod
+    def build(cls, grid):
+        size = grid.size
+        cells = grid.cells
+        goal = grid.find('X')
+        distances = array('i', [-1]) * (size * size)
+        directions = bytearray([NO_MOVE]) * (size * size)
+        if goal == (-1, -1):
+            return cls(size, goal, distances, directions)
+
+        # Para llegar desde la vecina a la celda actual se usa el movimiento
+        # opuesto: MOVES[i] y MOVES[i ^ 2] son direcciones contrarias
+        offsets = [dx * size + dy for dx, dy in MOVES]
+        origin = goal[0] * size + goal[1]
+        distances[origin] = 0
+        queue = deque([origin])
+        while queue:
+            index = queue.popleft()
+            x, y = divmod(index, size)
+            step = distances[index] + 1
+            for code, (dx, dy) in enumerate(MOVES):
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < size and 0 <= ny < size):
+                    continue
+                neighbor = index + offsets[code]
+                if distances[neighbor] == -1 and cells[neighbor] != WALL:
+                    distances[neighbor] = step
+                    directions[neighbor] = code ^ 2
+                    queue.append(neighbor)
+        return cls(size, goal, distances, directions)
+
+    def distance(self, x, y):
+        return self.distances[x * self.size + y]
+
+    def path(self, x, y):
+        if self.distance(x, y) == -1:
+            return None
+        path = [(x, y)]
+        code = self.directions[x * self.size + y]
+        while code != NO_MOVE:
+            dx, dy = MOVES[code]
+            x, y = x + dx, y + dy
+            path.append((x, y))
+            code = self.directions[x * self.size + y]
+        return path
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, self.size, *self.goal))
+            f.write(self.distances.tobytes())
+            f.write(self.directions)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            magic, size, gx, gy = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"{path} no es un campo de distancias")
+            distances = array('i')
+            distances.fromfile(f, size * size)
+            directions = bytearray(f.read(size * size))
+        return cls(size, (gx, gy), distances, directions)
+
+
+def main():
+    if len(sys.argv) < 3:
+        print("Uso: python laberinto_distancias.py <archivo.txt> <tamaño>")
+        return
+    source, size = sys.argv[1], int(sys.argv[2])
+    with open(source) as f:
+        maze_string = ''.join(line.rstrip('\r\n') for line in f)
+    if len(maze_string) != size * size:
+        print(f"Error: La cadena debe tener exactamente {size*size} caracteres")
+        return
+    field = GoalDistanceField.build(GridMaze(size, maze_string))
+    field.save(source + '.dist')
+    reachable = sum(1 for d in field.distances if d >= 0)
+    print(f"Campo de distancias guardado en {source}.dist ({reachable} celdas alcanzan la meta)")
+
+
+if __name__ == "__main__":
+    main()
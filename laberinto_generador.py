@@ -0,0 +1,220 @@
+import random
+import sys
+from array import array
+
+WALL = ord('+')
+FREE = ord(' ')
+
+
+# Los generadores trabajan sobre una rejilla de celdas en coordenadas impares:
+# la celda (r, c) ocupa la posición (2r+1, 2c+1) del laberinto y las paredes
+# entre celdas vecinas quedan en las posiciones intermedias.
+class _Carver:
+    def __init__(self, size):
+        # Con tamaño 3 o 4 sólo cabe una celda y '0' y 'X' coincidirían
+        if size < 5:
+            raise ValueError("El tamaño mínimo del laberinto es 5")
+        self.size = size
+        self.width = (size - 1) // 2
+        self.grid = bytearray([WALL]) * (size * size)
+
+    def index(self, cell):
+        r, c = divmod(cell, self.width)
+        return (2 * r + 1) * self.size + 2 * c + 1
+
+    def neighbors(self, cell):
+        w = self.width
+        r, c = divmod(cell, w)
+        result = []
+        if r > 0:
+            result.append(cell - w)
+        if c < w - 1:
+            result.append(cell + 1)
+        if r < w - 1:
+            result.append(cell + w)
+        if c > 0:
+            result.append(cell - 1)
+        return result
+
+    def carve(self, a, b):
+        ia, ib = self.index(a), self.index(b)
+        grid = self.grid
+        grid[ia] = FREE
+        grid[ib] = FREE
+        grid[(ia + ib) >> 1] = FREE
+
+    def to_string(self):
+        grid = self.grid
+        grid[self.index(0)] = ord('0')
+        grid[self.index(self.width * self.width - 1)] = ord('X')
+        return grid.decode('latin-1')
+
+
+def _backtracker(carver, rng):
+    w = carver.width
+    total = w * w
+    visited = bytearray(total)
+    grid = carver.grid
+    size = carver.size
+    rand = rng.random
+    stack = [0]
+    visited[0] = 1
+    grid[carver.index(0)] = FREE
+
+    while stack:
+        cell = stack[-1]
+        r, c = divmod(cell, w)
+        options = []
+        if r > 0 and not visited[cell - w]:
+            options.append(cell - w)
+        if c < w - 1 and not visited[cell + 1]:
+            options.append(cell + 1)
+        if r < w - 1 and not visited[cell + w]:
+            options.append(cell + w)
+        if c > 0 and not visited[cell - 1]:
+            options.append(cell - 1)
+        if not options:
+            stack.pop()
+            continue
+        nxt = options[int(rand() * len(options))]
+        visited[nxt] = 1
+        # Índices en el laberinto de la celda actual y de la vecina
+        ia = (2 * r + 1) * size + 2 * c + 1
+        nr, nc = divmod(nxt, w)
+        ib = (2 * nr + 1) * size + 2 * nc + 1
+        grid[ib] = FREE
+        grid[(ia + ib) >> 1] = FREE
+        stack.append(nxt)
+
+
+def _kruskal(carver, rng):
+    w = carver.width
+    total = w * w
+    parent = array('i', range(total))
+    # Aristas codificadas como 2*celda (hacia la derecha) y 2*celda+1 (hacia abajo)
+    edges = array('i', [2 * cell for cell in range(total) if (cell + 1) % w])
+    edges.extend(2 * cell + 1 for cell in range(total - w))
+    rng.shuffle(edges)
+    grid = carver.grid
+    size = carver.size
+    for cell in range(total):
+        grid[carver.index(cell)] = FREE
+
+    remaining = total - 1
+    for e in edges:
+        a = e >> 1
+        b = a + w if e & 1 else a + 1
+        # Union-find con compresión de caminos por división a la mitad
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+        if a == b:
+            continue
+        parent[a] = b
+        # Todas las celdas ya están abiertas: sólo falta quitar la pared
+        r, c = divmod(e >> 1, w)
+        grid[(2 * r + 1) * size + 2 * c + 1 + (size if e & 1 else 1)] = FREE
+        remaining -= 1
+        if not remaining:
+            break
+
+
+def _wilson(carver, rng):
+    # Árbol generador uniforme mediante caminatas aleatorias con borrado de
+    # ciclos: la dirección guardada por celda se sobrescribe al revisitarla
+    w = carver.width
+    total = w * w
+    in_tree = bytearray(total)
+    step = array('i', [0]) * total
+    in_tree[0] = 1
+    carver.grid[carver.index(0)] = FREE
+    rand = rng.random
+    neighbors = carver.neighbors
+
+    for origin in range(total):
+        if in_tree[origin]:
+            continue
+        cell = origin
+        while not in_tree[cell]:
+            options = neighbors(cell)
+            nxt = options[int(rand() * len(options))]
+            step[cell] = nxt
+            cell = nxt
+        cell = origin
+        while not in_tree[cell]:
+            in_tree[cell] = 1
+            carver.carve(cell, step[cell])
+            cell = step[cell]
+
+
+ALGORITHMS = {
+    'backtracker': _backtracker,
+    'kruskal': _kruskal,
+    'wilson': _wilson,
+}
+
+
+def _braid(carver, loops, rng):
+    # Elimina una fracción de los callejones sin salida abriendo una pared
+    # hacia otra celda, lo que crea ciclos (laberinto "trenzado")
+    grid = carver.grid
+    index = carver.index
+    for cell in range(carver.width * carver.width):
+        ia = index(cell)
+        closed = []
+        open_count = 0
+        for nxt in carver.neighbors(cell):
+            if grid[(ia + index(nxt)) >> 1] == FREE:
+                open_count += 1
+            else:
+                closed.append(nxt)
+        if open_count == 1 and closed and rng.random() < loops:
+            carver.carve(cell, rng.choice(closed))
+
+
+def _rooms(carver, rooms, max_room, rng):
+    size = carver.size
+    grid = carver.grid
+    for _ in range(rooms):
+        h = rng.randint(2, max_room)
+        w = rng.randint(2, max_room)
+        top = rng.randint(1, max(1, size - h - 1))
+        left = rng.randint(1, max(1, size - w - 1))
+        for r in range(top, min(top + h, size - 1)):
+            lo = r * size + left
+            hi = r * size + min(left + w, size - 1)
+            grid[lo:hi] = bytes([FREE]) * (hi - lo)
+
+
+def generate(size, algorithm='backtracker', seed=None, loops=0.0, rooms=0, max_room=8):
+    rng = random.Random(seed)
+    carver = _Carver(size)
+    ALGORITHMS[algorithm](carver, rng)
+    if loops > 0:
+        _braid(carver, loops, rng)
+    if rooms > 0:
+        _rooms(carver, rooms, max_room, rng)
+    return carver.to_string()
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Uso: python laberinto_generador.py <tamaño> [algoritmo] [semilla] "
+              "[densidad_ciclos] [habitaciones]")
+        print(f"Algoritmos: {', '.join(ALGORITHMS)}")
+        return
+    size = int(sys.argv[1])
+    algorithm = sys.argv[2] if len(sys.argv) > 2 else 'backtracker'
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    loops = float(sys.argv[4]) if len(sys.argv) > 4 else 0.0
+    rooms = int(sys.argv[5]) if len(sys.argv) > 5 else 0
+    maze = generate(size, algorithm, seed, loops, rooms)
+    for i in range(0, len(maze), size):
+        print(maze[i:i+size])
+
+
+if __name__ == "__main__":
+    main()
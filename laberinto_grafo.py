@@ -0,0 +1,281 @@
+import heapq
+import sys
+from array import array
+from collections import deque
+
+from laberinto_busqueda import MOVES, NOTHING, WALL, GridMaze, manhattan
+from laberinto_curvas import ORDERS
+
+
+# Grafo compilado en formato CSR: sólo las celdas libres son nodos, numerados
+# de forma densa en orden de fila o, con order='morton' u order='hilbert', a lo
+# largo de esa curva para que las celdas vecinas queden cerca en memoria. Los
+# vecinos del nodo n son neighbors[offsets[n]:offsets[n + 1]], en el mismo
+# orden que MOVES, así que los motores recorren los mismos caminos que sobre
+# la cuadrícula sin volver a comprobar límites ni paredes.
+class MazeGraph:
+    def __init__(self, size, node_of, cell_of, offsets, neighbors, order='fila'):
+        self.size = size
+        self.order = order
+        self.node_of = node_of
+        self.cell_of = cell_of
+        self.offsets = offsets
+        self.neighbors = neighbors
+
+    @classmethod
+    def compile(cls, grid, order='fila'):
+        if order not in ORDERS:
+            raise ValueError(f"Orden desconocido: {order}")
+        size = grid.size
+        cells = grid.cells
+        node_of = array('i', [-1]) * (size * size)
+        cell_of = array('i', (index for index in range(size * size) if cells[index] != WALL))
+        key = ORDERS[order]
+        if key is not None:
+            cell_of = array('i', sorted(cell_of, key=lambda index: key(size, *divmod(index, size))))
+        for node, index in enumerate(cell_of):
+            node_of[index] = node
+
+        offsets = array('i', [0])
+        neighbors = array('i')
+        for index in cell_of:
+            x, y = divmod(index, size)
+            for dx, dy in MOVES:
+                if grid.is_open(x + dx, y + dy):
+                    neighbors.append(node_of[(x + dx) * size + y + dy])
+            offsets.append(len(neighbors))
+        return cls(size, node_of, cell_of, offsets, neighbors, order)
+
+    def __len__(self):
+        return len(self.cell_of)
+
+    def node(self, x, y):
+        if 0 <= x < self.size and 0 <= y < self.size:
+            return self.node_of[x * self.size + y]
+        return -1
+
+    def cell(self, node):
+        return divmod(self.cell_of[node], self.size)
+
+    def is_open(self, x, y):
+        return self.node(x, y) != -1
+
+    def adjacent(self, node):
+        return self.neighbors[self.offsets[node]:self.offsets[node + 1]]
+
+    def _path(self, parents, end):
+        path = []
+        node = end
+        while True:
+            path.append(self.cell(node))
+            if parents[node] == node:
+                break
+            node = parents[node]
+        path.reverse()
+        return path
+
+    def _restrictions(self, blocked, blocked_edges):
+        nodes = {self.node(*cell) for cell in blocked}
+        edges = {(self.node(*a), self.node(*b)) for a, b in blocked_edges}
+        return nodes, edges
+
+
+def bfs(graph, start, end, counters=None, blocked=NOTHING, blocked_edges=NOTHING):
+    # Misma BFS que laberinto_busqueda.bfs, con los mismos argumentos, pero
+    # sobre nodos del grafo compilado; sirve también como motor de Yen
+    source, target = graph.node(*start), graph.node(*end)
+    if source == -1 or target == -1:
+        return None
+    offsets, neighbors = graph.offsets, graph.neighbors
+    parents = array('i', [-1]) * len(graph)
+    parents[source] = source
+    queue = deque([source])
+    restricted = bool(blocked or blocked_edges)
+    if restricted:
+        blocked, blocked_edges = graph._restrictions(blocked, blocked_edges)
+    expanded = 0
+    found = False
+
+    while queue:
+        node = queue.popleft()
+        expanded += 1
+        if node == target:
+            found = True
+            break
+        for nxt in neighbors[offsets[node]:offsets[node + 1]]:
+            if parents[nxt] == -1:
+                if restricted and (nxt in blocked or (node, nxt) in blocked_edges):
+                    continue
+                parents[nxt] = node
+                queue.append(nxt)
+
+    if counters is not None:
+        counters['expanded'] = counters.get('expanded', 0) + expanded
+    return graph._path(parents, target) if found else None
+
+
+def astar(graph, start, end, counters=None, heuristic=manhattan,
+          blocked=NOTHING, blocked_edges=NOTHING):
+    # Con el orden de fila los empates del montículo se resuelven igual que con
+    # las tuplas (x, y) de laberinto_busqueda.astar; con otra curva el camino
+    # puede ser otro de la misma longitud
+    source, target = graph.node(*start), graph.node(*end)
+    if source == -1 or target == -1:
+        return None
+    offsets, neighbors = graph.offsets, graph.neighbors
+    parents = array('i', [-1]) * len(graph)
+    costs = array('i', [-1]) * len(graph)
+    parents[source] = source
+    costs[source] = 0
+    heap = [(heuristic(start, end), 0, source)]
+    restricted = bool(blocked or blocked_edges)
+    if restricted:
+        blocked, blocked_edges = graph._restrictions(blocked, blocked_edges)
+    expanded = 0
+    found = False
+
+    while heap:
+        _, g, node = heapq.heappop(heap)
+        if g > costs[node]:
+            continue
+        expanded += 1
+        if node == target:
+            found = True
+            break
+        ng = g + 1
+        for nxt in neighbors[offsets[node]:offsets[node + 1]]:
+            if costs[nxt] == -1 or ng < costs[nxt]:
+                if restricted and (nxt in blocked or (node, nxt) in blocked_edges):
+                    continue
+                costs[nxt] = ng
+                parents[nxt] = node
+                heapq.heappush(heap, (ng + heuristic(graph.cell(nxt), end), ng, nxt))
+
+    if counters is not None:
+        counters['expanded'] = counters.get('expanded', 0) + expanded
+    return graph._path(parents, target) if found else None
+
+
+def all_paths(graph, start, end, counters=None):
+    # Enumeración de todos los caminos simples en el mismo orden que
+    # MazeSolver._find_all_solutions; position[i] es el siguiente índice de
+    # neighbors a probar desde el nodo en la profundidad i
+    source, target = graph.node(*start), graph.node(*end)
+    if source == -1 or target == -1:
+        return
+    offsets, neighbors = graph.offsets, graph.neighbors
+    visited = bytearray(len(graph))
+    visited[source] = 1
+    path = [source]
+    position = [offsets[source]]
+    pushes = 1
+    try:
+        while path:
+            node = path[-1]
+            if node == target:
+                yield [graph.cell(n) for n in path]
+                visited[path.pop()] = 0
+                position.pop()
+                continue
+            i = position[-1]
+            if i == offsets[node + 1]:
+                visited[path.pop()] = 0
+                position.pop()
+                continue
+            position[-1] = i + 1
+            nxt = neighbors[i]
+            if not visited[nxt]:
+                visited[nxt] = 1
+                path.append(nxt)
+                position.append(offsets[nxt])
+                pushes += 1
+    finally:
+        if counters is not None:
+            counters['expanded'] = counters.get('expanded', 0) + pushes
+
+
+def nearest_goals(graph, starts, goals, counters=None):
+    # BFS multifuente desde todas las metas a la vez: cada nodo queda
+    # etiquetado con su meta más cercana, y la búsqueda termina en cuanto se
+    # han etiquetado todos los inicios. Devuelve {inicio: (meta, distancia)}
+    # (None si no alcanza ninguna) y el camino del mejor par, o None
+    offsets, neighbors = graph.offsets, graph.neighbors
+    owner = array('i', [-1]) * len(graph)
+    distances = array('i', [-1]) * len(graph)
+    parents = array('i', [-1]) * len(graph)
+    queue = deque()
+    for g, goal in enumerate(goals):
+        node = graph.node(*goal)
+        if node != -1 and owner[node] == -1:
+            owner[node] = g
+            distances[node] = 0
+            queue.append(node)
+    pending = {graph.node(*start) for start in starts}
+    pending.discard(-1)
+    pending.difference_update(queue)
+    expanded = 0
+
+    while queue and pending:
+        node = queue.popleft()
+        expanded += 1
+        for nxt in neighbors[offsets[node]:offsets[node + 1]]:
+            if owner[nxt] == -1:
+                owner[nxt] = owner[node]
+                distances[nxt] = distances[node] + 1
+                parents[nxt] = node
+                queue.append(nxt)
+                pending.discard(nxt)
+
+    if counters is not None:
+        counters['expanded'] = counters.get('expanded', 0) + expanded
+    nearest = {}
+    best = None
+    for start in starts:
+        node = graph.node(*start)
+        if node == -1 or owner[node] == -1:
+            nearest[start] = None
+            continue
+        nearest[start] = (goals[owner[node]], distances[node])
+        if best is None or distances[node] < distances[best]:
+            best = node
+    if best is None:
+        return nearest, None
+    # Los padres apuntan hacia la meta, así que el camino sale ya en orden
+    path = [graph.cell(best)]
+    while parents[best] != -1:
+        best = parents[best]
+        path.append(graph.cell(best))
+    return nearest, path
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Uso: python laberinto_grafo.py <tamaño> [semilla] [densidad_ciclos]")
+        return
+    import time
+    from laberinto_busqueda import astar as grid_astar, bfs as grid_bfs
+    from laberinto_generador import generate
+
+    size = int(sys.argv[1])
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    loops = float(sys.argv[3]) if len(sys.argv) > 3 else 0.0
+    grid = GridMaze(size, generate(size, 'kruskal', seed, loops=loops))
+    start, end = grid.find('0'), grid.find('X')
+
+    started = time.perf_counter()
+    graph = MazeGraph.compile(grid)
+    print(f"Compilación: {len(graph)} nodos, {len(graph.neighbors)} aristas dirigidas, "
+          f"{time.perf_counter() - started:.3f} segundos")
+    for name, on_grid, on_graph in (('BFS', grid_bfs, bfs), ('A*', grid_astar, astar)):
+        started = time.perf_counter()
+        expected = on_grid(grid, start, end)
+        grid_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        path = on_graph(graph, start, end)
+        graph_seconds = time.perf_counter() - started
+        assert path == expected, f"{name} sobre el grafo no coincide con la cuadrícula"
+        print(f"{name}: cuadrícula {grid_seconds:.3f} s, CSR {graph_seconds:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+import heapq
+import sys
+from collections import deque
+
+from laberinto_busqueda import MOVES, WALL, GridMaze, astar, manhattan
+
+FREE = ord(' ')
+
+
+# Búsqueda jerárquica (HPA*): el laberinto se divide en bloques de
+# cluster_size x cluster_size; en cada frontera entre bloques se elige una
+# entrada por tramo abierto y dentro de cada bloque se precalculan las
+# distancias entre sus entradas. Las consultas buscan en ese grafo abstracto
+# y sólo refinan con BFS local los tramos del camino elegido. Al cambiar una
+# celda se invalidan únicamente su bloque y los vecinos.
+# Como en el HPA* original, el camino puede ser más largo que el óptimo: con
+# cluster_size=16, en laberintos de 61 a 101 con ediciones intercaladas, hasta
+# un 2 % de las consultas devuelven un camino más largo (en media un 2-3 % más,
+# hasta un 29 % en el peor caso). Si hace falta el óptimo, usar astar.
+class HierarchicalMaze:
+    def __init__(self, grid, cluster_size=16):
+        self.grid = grid
+        self.size = grid.size
+        self.cluster_size = cluster_size
+        self.clusters_per_side = -(-self.size // cluster_size)
+        self.borders = {}
+        self.intra = {}
+        self.expanded = 0
+        total = self.clusters_per_side * self.clusters_per_side
+        self._dirty = set(range(total))
+        self._adjacency = None
+
+    def cluster_of(self, cell):
+        return ((cell[0] // self.cluster_size) * self.clusters_per_side +
+                cell[1] // self.cluster_size)
+
+    def _bounds(self, cid):
+        cr, cc = divmod(cid, self.clusters_per_side)
+        c = self.cluster_size
+        return cr * c, min((cr + 1) * c, self.size), cc * c, min((cc + 1) * c, self.size)
+
+    def _neighbor_clusters(self, cid):
+        cr, cc = divmod(cid, self.clusters_per_side)
+        side = self.clusters_per_side
+        for dr, dc in MOVES:
+            if 0 <= cr + dr < side and 0 <= cc + dc < side:
+                yield (cr + dr) * side + cc + dc
+
+    def _scan_border(self, a, b):
+        # Tramos contiguos de pares de celdas abiertas a ambos lados de la
+        # frontera entre los bloques a < b; se usa el par central de cada tramo
+        top, bottom, left, right = self._bounds(a)
+        is_open = self.grid.is_open
+        if b == a + 1:
+            pairs = [((x, right - 1), (x, right)) for x in range(top, bottom)]
+        else:
+            pairs = [((bottom - 1, y), (bottom, y)) for y in range(left, right)]
+        entrances = []
+        run = []
+        for p, q in pairs + [(None, None)]:
+            if p is not None and is_open(*p) and is_open(*q):
+                run.append((p, q))
+            elif run:
+                entrances.append(run[len(run) // 2])
+                run = []
+        return entrances
+
+    def _local_distances(self, cid, source, targets=None):
+        top, bottom, left, right = self._bounds(cid)
+        is_open = self.grid.is_open
+        distances = {source: 0}
+        parents = {source: None}
+        queue = deque([source])
+        # Sin objetivos (p. ej. un bloque sin entradas) se recorre el bloque entero
+        remaining = set(targets) if targets else None
+        while queue:
+            cell = queue.popleft()
+            self.expanded += 1
+            if remaining is not None:
+                remaining.discard(cell)
+                if not remaining:
+                    break
+            x, y = cell
+            for dx, dy in MOVES:
+                nx, ny = x + dx, y + dy
+                if (top <= nx < bottom and left <= ny < right and
+                        (nx, ny) not in distances and is_open(nx, ny)):
+                    distances[(nx, ny)] = distances[cell] + 1
+                    parents[(nx, ny)] = cell
+                    queue.append((nx, ny))
+        return distances, parents
+
+    def _nodes(self, cid):
+        nodes = set()
+        for other in self._neighbor_clusters(cid):
+            a, b = min(cid, other), max(cid, other)
+            for p, q in self.borders.get((a, b), ()):
+                nodes.add(p if a == cid else q)
+        return nodes
+
+    def _rebuild(self):
+        if not self._dirty:
+            return
+        borders = {(min(cid, other), max(cid, other))
+                   for cid in self._dirty for other in self._neighbor_clusters(cid)}
+        for a, b in borders:
+            self.borders[(a, b)] = self._scan_border(a, b)
+        affected = set(self._dirty)
+        for cid in self._dirty:
+            affected.update(self._neighbor_clusters(cid))
+        for cid in affected:
+            nodes = self._nodes(cid)
+            table = {}
+            for node in nodes:
+                distances, _ = self._local_distances(cid, node, nodes)
+                table[node] = {other: distances[other] for other in nodes
+                               if other != node and other in distances}
+            self.intra[cid] = table
+        self._dirty.clear()
+        self._adjacency = None
+
+    def _abstract_graph(self):
+        self._rebuild()
+        if self._adjacency is None:
+            adjacency = {}
+            for table in self.intra.values():
+                for node, edges in table.items():
+                    adjacency.setdefault(node, {}).update(edges)
+            for entrances in self.borders.values():
+                for p, q in entrances:
+                    adjacency.setdefault(p, {})[q] = 1
+                    adjacency.setdefault(q, {})[p] = 1
+            self._adjacency = adjacency
+        return self._adjacency
+
+    def _touch(self, x, y, value):
+        index = x * self.size + y
+        if self.grid.cells[index] in (ord('0'), ord('X')) or self.grid.cells[index] == value:
+            return
+        self.grid.cells[index] = value
+        self._dirty.add(self.cluster_of((x, y)))
+
+    def set_wall(self, x, y):
+        self._touch(x, y, WALL)
+
+    def clear_wall(self, x, y):
+        self._touch(x, y, FREE)
+
+    def shortest_path(self, start, end, counters=None):
+        if start == end:
+            return [start]
+        before = self.expanded
+        adjacency = self._abstract_graph()
+        start_cluster, end_cluster = self.cluster_of(start), self.cluster_of(end)
+
+        # Conecta temporalmente inicio y meta con las entradas de sus bloques
+        start_nodes = self.intra[start_cluster].keys()
+        start_targets = set(start_nodes)
+        if start_cluster == end_cluster:
+            start_targets.add(end)
+        start_dist, _ = self._local_distances(start_cluster, start, start_targets)
+        end_nodes = self.intra[end_cluster].keys()
+        end_dist, _ = self._local_distances(end_cluster, end, end_nodes)
+
+        best_cost, best_path = None, None
+        if start_cluster == end_cluster and end in start_dist:
+            best_cost = start_dist[end]
+            best_path = [start, end]
+
+        goal_edges = {node: end_dist[node] for node in end_nodes if node in end_dist}
+        costs = {start: 0}
+        parents = {start: None}
+        heap = [(manhattan(start, end), 0, start)]
+        start_edges = dict(adjacency.get(start, {}))
+        start_edges.update((n, start_dist[n]) for n in start_nodes if n in start_dist)
+        while heap:
+            f, g, node = heapq.heappop(heap)
+            if best_cost is not None and f >= best_cost:
+                break
+            if g > costs[node]:
+                continue
+            self.expanded += 1
+            if node in goal_edges and (best_cost is None or g + goal_edges[node] < best_cost):
+                best_cost = g + goal_edges[node]
+                best_path = self._trace(parents, node)
+                if node != end:
+                    best_path.append(end)
+            edges = start_edges if node == start else adjacency.get(node, {})
+            for nxt, cost in edges.items():
+                ng = g + cost
+                if ng < costs.get(nxt, ng + 1):
+                    costs[nxt] = ng
+                    parents[nxt] = node
+                    heapq.heappush(heap, (ng + manhattan(nxt, end), ng, nxt))
+
+        path = None if best_path is None else self._refine(best_path)
+        if counters is not None:
+            counters['expanded'] = counters.get('expanded', 0) + self.expanded - before
+        return path
+
+    @staticmethod
+    def _trace(parents, node):
+        path = []
+        while node is not None:
+            path.append(node)
+            node = parents[node]
+        path.reverse()
+        return path
+
+    def _refine(self, waypoints):
+        # Cada tramo es un paso entre bloques (celdas vecinas) o un camino
+        # dentro de un mismo bloque, que se reconstruye con BFS local
+        path = [waypoints[0]]
+        for a, b in zip(waypoints, waypoints[1:]):
+            if manhattan(a, b) == 1 and self.cluster_of(a) != self.cluster_of(b):
+                path.append(b)
+                continue
+            _, parents = self._local_distances(self.cluster_of(a), a, [b])
+            segment = self._trace(parents, b)
+            path.extend(segment[1:])
+        return path
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Uso: python laberinto_jerarquico.py <tamaño> [tamaño_bloque] [consultas] [semilla]")
+        return
+    import random
+    from laberinto_generador import generate
+
+    size = int(sys.argv[1])
+    cluster_size = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    queries = int(sys.argv[3]) if len(sys.argv) > 3 else 300
+    seed = int(sys.argv[4]) if len(sys.argv) > 4 else 1
+    rng = random.Random(seed)
+    grid = GridMaze(size, generate(size, 'kruskal', seed, loops=0.1))
+    maze = HierarchicalMaze(grid, cluster_size)
+
+    # Comprueba contra A* con ediciones intercaladas; los laberintos que caben
+    # en un solo bloque y los bloques sin entradas deben seguir funcionando
+    longer = 0
+    for i in range(queries):
+        if i % 10 == 0:
+            for _ in range(5):
+                x, y = rng.randrange(size), rng.randrange(size)
+                (maze.set_wall if rng.random() < 0.5 else maze.clear_wall)(x, y)
+        free = [divmod(j, size) for j, c in enumerate(grid.cells) if c != WALL]
+        a, b = rng.choice(free), rng.choice(free)
+        path = maze.shortest_path(a, b)
+        expected = astar(grid, a, b)
+        assert (path is None) == (expected is None), f"{a} -> {b}: alcanzabilidad distinta"
+        if path is not None:
+            assert path[0] == a and path[-1] == b
+            assert all(manhattan(p, q) == 1 and grid.is_open(*q) for p, q in zip(path, path[1:]))
+            longer += len(path) > len(expected)
+    print(f"{queries} consultas en un laberinto {size}x{size} con bloques de {cluster_size}")
+    print(f"Caminos más largos que el óptimo: {longer}")
+
+
+if __name__ == "__main__":
+    main()
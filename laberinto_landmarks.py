@@ -0,0 +1,78 @@
+import sys
+
+from laberinto_busqueda import GridMaze, astar, bfs_distances, manhattan
+
+
+# Heurística ALT (A*, Landmarks y desigualdad triangular): se eligen k celdas
+# de referencia por selección del punto más lejano y se guardan sus
+# distancias BFS. Para cualquier par (a, b), |d(L, a) - d(L, b)| es una cota
+# inferior admisible de d(a, b), mucho más ajustada que Manhattan en laberintos.
+class Landmarks:
+    def __init__(self, grid, k=8, seed=None):
+        self.size = grid.size
+        self.landmarks = []
+        self.tables = []
+        if seed is None:
+            seed = grid.find('0')
+        if seed == (-1, -1) or not grid.is_open(*seed):
+            return
+
+        # La primera referencia es la celda más lejana a seed; cada nueva
+        # referencia maximiza la distancia mínima a las ya elegidas
+        nearest = bfs_distances(grid, seed)
+        for _ in range(k):
+            index = max(range(len(nearest)), key=nearest.__getitem__)
+            if nearest[index] <= 0 and self.landmarks:
+                break
+            landmark = divmod(index, self.size)
+            table = bfs_distances(grid, landmark)
+            self.landmarks.append(landmark)
+            self.tables.append(table)
+            nearest = [min(a, b) if a >= 0 else -1 for a, b in zip(nearest, table)]
+
+    def heuristic(self, a, b):
+        ia = a[0] * self.size + a[1]
+        ib = b[0] * self.size + b[1]
+        best = manhattan(a, b)
+        for table in self.tables:
+            da, db = table[ia], table[ib]
+            if da >= 0 and db >= 0:
+                bound = da - db if da > db else db - da
+                if bound > best:
+                    best = bound
+        return best
+
+    def search(self, grid, start, end, counters=None):
+        return astar(grid, start, end, counters, heuristic=self.heuristic)
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Uso: python laberinto_landmarks.py <tamaño> [referencias] [consultas] [semilla]")
+        return
+    import random
+    from laberinto_generador import generate
+
+    size = int(sys.argv[1])
+    k = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    queries = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+    seed = int(sys.argv[4]) if len(sys.argv) > 4 else 1
+    grid = GridMaze(size, generate(size, 'kruskal', seed, loops=0.1))
+    landmarks = Landmarks(grid, k)
+    rng = random.Random(seed)
+    free = [divmod(i, size) for i, c in enumerate(grid.cells) if c != ord('+')]
+
+    plain, alt = {}, {}
+    for _ in range(queries):
+        a, b = rng.choice(free), rng.choice(free)
+        p = astar(grid, a, b, plain)
+        q = landmarks.search(grid, a, b, alt)
+        assert (p is None) == (q is None) and (p is None or len(p) == len(q))
+    print(f"{queries} consultas en un laberinto {size}x{size} con {len(landmarks.landmarks)} referencias")
+    print(f"Nodos expandidos con Manhattan: {plain['expanded']}")
+    print(f"Nodos expandidos con ALT:       {alt['expanded']}")
+    print(f"Reducción: {plain['expanded'] / alt['expanded']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
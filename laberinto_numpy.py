@@ -0,0 +1,129 @@
+import sys
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from laberinto_busqueda import MOVES, WALL, GridMaze
+
+
+def _require_numpy():
+    if np is None:
+        raise RuntimeError("El motor vectorizado necesita NumPy (pip install numpy)")
+
+
+# Transformada de distancias con NumPy: la cuadrícula se rodea de un borde de
+# paredes de una celda, de modo que los desplazamientos ±1 y ±ancho sobre el
+# índice plano nunca se salen del array ni pasan de una fila a otra. Cada capa
+# de la BFS es una sola operación vectorizada sobre el frente completo.
+class VectorGrid:
+    def __init__(self, grid):
+        _require_numpy()
+        self.size = grid.size
+        self.width = grid.size + 2
+        walls = np.frombuffer(bytes(grid.cells), dtype=np.uint8).reshape(grid.size, grid.size) == WALL
+        padded = np.ones((self.width, self.width), dtype=bool)
+        padded[1:-1, 1:-1] = walls
+        self.walls = padded.ravel()
+        self.offsets = np.array([dx * self.width + dy for dx, dy in MOVES], dtype=np.intp)
+
+    def _index(self, cell):
+        return (cell[0] + 1) * self.width + cell[1] + 1
+
+    def wavefront(self, source, target=None, counters=None):
+        # Distancias desde source a todas las celdas del borde ampliado (-1 si
+        # no se alcanzan); si se da target se detiene en cuanto lo etiqueta
+        distances = np.full(self.width * self.width, -1, dtype=np.int32)
+        origin = self._index(source)
+        if self.walls[origin]:
+            return distances
+        pending = ~self.walls
+        pending[origin] = False
+        distances[origin] = 0
+        goal = -1 if target is None else self._index(target)
+        frontier = np.array([origin], dtype=np.intp)
+        step = 0
+        reached = 1
+        while frontier.size and (goal == -1 or distances[goal] == -1):
+            step += 1
+            candidates = (frontier[:, None] + self.offsets).ravel()
+            frontier = np.unique(candidates[pending[candidates]])
+            pending[frontier] = False
+            distances[frontier] = step
+            reached += frontier.size
+        if counters is not None:
+            counters['expanded'] = counters.get('expanded', 0) + reached
+        return distances
+
+    def distances(self, source):
+        # Mismo formato que laberinto_busqueda.bfs_distances: array('i') plano
+        field = self.wavefront(source).reshape(self.width, self.width)[1:-1, 1:-1]
+        result = array('i')
+        result.frombytes(np.ascontiguousarray(field).tobytes())
+        return result
+
+    def descend(self, distances, start):
+        # Descenso por el gradiente: desde start se avanza siempre a la vecina
+        # (en el orden de MOVES) cuya distancia es exactamente una menos
+        index = self._index(start)
+        if distances[index] == -1:
+            return None
+        path = [start]
+        offsets = self.offsets.tolist()
+        while distances[index] > 0:
+            below = distances[index] - 1
+            index = next(index + o for o in offsets if distances[index + o] == below)
+            x, y = divmod(index, self.width)
+            path.append((x - 1, y - 1))
+        return path
+
+    def shortest_path(self, start, end, counters=None):
+        # El frente sale de la meta y se detiene al alcanzar el inicio, así
+        # el descenso desde el inicio reconstruye el camino en orden directo
+        return self.descend(self.wavefront(end, start, counters), start)
+
+
+def bfs_distances(grid, source):
+    return VectorGrid(grid).distances(source)
+
+
+def bfs(grid, start, end, counters=None):
+    return VectorGrid(grid).shortest_path(start, end, counters)
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Uso: python laberinto_numpy.py <tamaño> [semilla] [densidad_ciclos]")
+        return
+    import time
+    from laberinto_busqueda import bfs_distances as python_distances
+    from laberinto_generador import generate
+
+    _require_numpy()
+    size = int(sys.argv[1])
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    loops = float(sys.argv[3]) if len(sys.argv) > 3 else 0.0
+    grid = GridMaze(size, generate(size, 'kruskal', seed, loops=loops))
+    source = grid.find('0')
+
+    started = time.perf_counter()
+    expected = python_distances(grid, source)
+    python_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    vector = VectorGrid(grid)
+    field = vector.distances(source)
+    numpy_seconds = time.perf_counter() - started
+    assert field == expected, "la transformada vectorizada no coincide con la BFS"
+
+    target = grid.find('X')
+    path = vector.shortest_path(source, target)
+    assert path is None or len(path) - 1 == expected[target[0] * size + target[1]]
+    print(f"Laberinto {size}x{size}: {max(expected) + 1} capas")
+    print(f"BFS en Python: {python_seconds:.3f} segundos")
+    print(f"BFS con NumPy: {numpy_seconds:.3f} segundos ({python_seconds / numpy_seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
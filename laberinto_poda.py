@@ -0,0 +1,68 @@
+import sys
+
+from laberinto_bits import BitMaze
+from laberinto_busqueda import WALL, GridMaze
+
+_ENDPOINT_DIGITS = bytes(ord('1') if c in b'0X' else ord('0') for c in range(256))
+
+
+# Relleno de callejones sin salida sobre el tablero de bits: en cada pasada se
+# cuentan a la vez las vecinas libres de todas las celdas (cuatro máscaras
+# desplazadas y un contador de dos bits) y se tapian las celdas con una vecina
+# o ninguna, salvo '0' y 'X'. Ninguna de ellas puede estar en un camino simple
+# entre inicio y meta, así que las soluciones no cambian.
+def dead_end_mask(board, keep=0):
+    size = board.size
+    free = board.free
+    removed = 0
+    passes = 0
+    while True:
+        neighbors = (((free >> 1) & board.not_last_column),
+                     ((free << 1) & board.not_first_column),
+                     free >> size,
+                     free << size)
+        at_least_one = at_least_two = 0
+        for mask in neighbors:
+            at_least_two |= at_least_one & mask
+            at_least_one |= mask
+        dead = free & ~at_least_two & ~keep
+        if not dead:
+            return removed, passes
+        free &= ~dead
+        removed |= dead
+        passes += 1
+
+
+def fill_dead_ends(grid):
+    # Devuelve el laberinto reducido, el número de celdas tapiadas y las pasadas
+    board = BitMaze(grid)
+    # Se conservan todas las celdas '0' y 'X', no sólo las primeras
+    keep = int(grid.cells.translate(_ENDPOINT_DIGITS)[::-1] or b'0', 2)
+    removed, passes = dead_end_mask(board, keep)
+    cells = bytearray(grid.cells)
+    for x, y in board.cells(removed):
+        cells[x * grid.size + y] = WALL
+    return GridMaze(grid.size, cells.decode('latin-1')), removed.bit_count(), passes
+
+
+def main():
+    if len(sys.argv) < 3:
+        print("Uso: python laberinto_poda.py <archivo.txt> <tamaño> [salida.txt]")
+        return
+    source, size = sys.argv[1], int(sys.argv[2])
+    with open(source) as f:
+        maze_string = ''.join(line.rstrip('\r\n') for line in f)
+    if len(maze_string) != size * size:
+        print(f"Error: La cadena debe tener exactamente {size*size} caracteres")
+        return
+    reduced, removed, passes = fill_dead_ends(GridMaze(size, maze_string))
+    target = sys.argv[3] if len(sys.argv) > 3 else source + '.podado'
+    text = reduced.cells.decode('latin-1')
+    with open(target, 'w') as f:
+        for i in range(0, size * size, size):
+            f.write(text[i:i + size] + '\n')
+    print(f"{removed} celdas de callejones tapiadas en {passes} pasadas; resultado en {target}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+from laberinto import CompactPath, Solution
+
+# Las 8 simetrías del cuadrado: la transformación t refleja la columna si
+# t >= 4 y luego rota 90° en sentido horario (t % 4) veces.
+TRANSFORMS = range(8)
+
+
+def transform_point(point, t, size):
+    x, y = point
+    if t >= 4:
+        y = size - 1 - y
+    for _ in range(t % 4):
+        x, y = y, size - 1 - x
+    return (x, y)
+
+
+def inverse_point(point, t, size):
+    x, y = point
+    for _ in range(t % 4):
+        x, y = size - 1 - y, x
+    if t >= 4:
+        y = size - 1 - y
+    return (x, y)
+
+
+def transform_maze(size, maze_string, t):
+    # Trabaja por filas: reflejar invierte cada fila y rotar en sentido
+    # horario es transponer las filas leídas de abajo hacia arriba
+    rows = [maze_string[i:i+size] for i in range(0, len(maze_string), size)]
+    if t >= 4:
+        rows = [row[::-1] for row in rows]
+    for _ in range(t % 4):
+        rows = [''.join(column) for column in zip(*rows[::-1])]
+    return ''.join(rows)
+
+
+def canonicalize(size, maze_string):
+    # Devuelve la menor (lexicográficamente) de las 8 variantes y la
+    # transformación que lleva el laberinto original a ella
+    best, best_t = maze_string, 0
+    for t in TRANSFORMS[1:]:
+        variant = transform_maze(size, maze_string, t)
+        if variant < best:
+            best, best_t = variant, t
+    return best, best_t
+
+
+def transform_path(path, t, size, inverse=False):
+    mapping = inverse_point if inverse else transform_point
+    return [mapping(point, t, size) for point in path]
+
+
+def transform_summary(summary, t, size, inverse=False):
+    if t == 0:
+        return summary
+
+    def convert(solution):
+        cells = transform_path(solution.path, t, size, inverse)
+        return Solution(CompactPath.from_cells(cells), solution.time_found, solution.length)
+
+    result = dict(summary)
+    for name in ('shortest', 'longest'):
+        if name in result:
+            result[name] = convert(result[name])
+    for name in ('shortest_k', 'longest_k'):
+        if name in result:
+            result[name] = [convert(sol) for sol in result[name]]
+    return result
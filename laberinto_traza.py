@@ -0,0 +1,220 @@
+import argparse
+import os
+import struct
+import time
+from array import array
+
+from laberinto import MazeSolver, SearchInstrumentation
+
+MAGIC = b'LABR'
+HEADER = struct.Struct('<4sI')
+SOLUTION = 1
+
+
+def _write_varint(buffer, value):
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(data, pos):
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+# Traza binaria de la búsqueda: cada movimiento se guarda como la diferencia
+# (zigzag) entre índices de celda seguida del tiempo transcurrido en
+# microsegundos, ambos como varint. Las soluciones son un marcador de un byte.
+class TraceRecorder:
+    def __init__(self, path, size, maze_cells, flush_bytes=1 << 16):
+        self.size = size
+        self.flush_bytes = flush_bytes
+        self._file = open(path, 'wb')
+        self._file.write(HEADER.pack(MAGIC, size))
+        self._file.write(bytes(maze_cells))
+        self._buffer = bytearray()
+        self._last_cell = 0
+        self._last_ns = time.perf_counter_ns()
+        self.events = 0
+
+    @classmethod
+    def attach(cls, solver, path):
+        if solver.instrumentation is None:
+            solver.instrumentation = SearchInstrumentation()
+        recorder = cls(path, solver.size, solver.grid.cells)
+        solver.instrumentation.on('move', recorder.move)
+        solver.instrumentation.on('solution', recorder.solution)
+        return recorder
+
+    def move(self, x, y):
+        cell = x * self.size + y
+        delta = cell - self._last_cell
+        self._last_cell = cell
+        now = time.perf_counter_ns()
+        elapsed = (now - self._last_ns) // 1000
+        self._last_ns = now
+        _write_varint(self._buffer, ((delta << 1) ^ (delta >> 63)) << 1)
+        _write_varint(self._buffer, elapsed)
+        self.events += 1
+        if len(self._buffer) >= self.flush_bytes:
+            self._flush()
+
+    def solution(self, *args):
+        self._buffer.append(SOLUTION)
+
+    def _flush(self):
+        self._file.write(self._buffer)
+        self._buffer.clear()
+
+    def close(self):
+        self._flush()
+        self._file.close()
+
+
+class Trace:
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        magic, size = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} no es una traza de búsqueda")
+        self.size = size
+        begin = HEADER.size + size * size
+        self.maze = data[HEADER.size:begin].decode('latin-1')
+        self.cells = array('i')
+        self.times = array('q')
+        self.solutions = array('i')
+
+        pos, cell, elapsed = begin, 0, 0
+        while pos < len(data):
+            token, pos = _read_varint(data, pos)
+            if token == SOLUTION:
+                self.solutions.append(len(self.cells) - 1)
+                continue
+            zigzag = token >> 1
+            cell += (zigzag >> 1) ^ -(zigzag & 1)
+            delta_us, pos = _read_varint(data, pos)
+            elapsed += delta_us
+            self.cells.append(cell)
+            self.times.append(elapsed)
+
+    def __len__(self):
+        return len(self.cells)
+
+    def path_at(self, step):
+        # Reconstruye el camino actual: volver a la celda anterior del camino
+        # es siempre un retroceso, cualquier otro movimiento es un avance
+        path = []
+        for i in range(step + 1):
+            cell = self.cells[i]
+            if len(path) > 1 and path[-2] == cell:
+                path.pop()
+            elif not path or path[-1] != cell:
+                path.append(cell)
+        return path
+
+
+class TraceReplayer:
+    def __init__(self, trace, delay_ms):
+        self.trace = trace
+        self.delay = delay_ms / 1000
+        self.path = []
+        self.step = -1
+
+    def seek(self, step):
+        self.step = max(-1, min(step, len(self.trace) - 1))
+        self.path = self.trace.path_at(self.step) if self.step >= 0 else []
+
+    def seek_solution(self, k):
+        self.seek(self.trace.solutions[k])
+
+    def advance(self):
+        self.step += 1
+        cell = self.trace.cells[self.step]
+        if len(self.path) > 1 and self.path[-2] == cell:
+            self.path.pop()
+        elif not self.path or self.path[-1] != cell:
+            self.path.append(cell)
+
+    def play(self, until=None):
+        until = len(self.trace) - 1 if until is None else min(until, len(self.trace) - 1)
+        while self.step < until:
+            self.advance()
+            self.render()
+            time.sleep(self.delay)
+
+    def render(self):
+        size = self.trace.size
+        maze = self.trace.maze
+        on_path = set(self.path)
+        current = self.path[-1] if self.path else -1
+        os.system('cls' if os.name == 'nt' else 'clear')
+        print("+" + "-" * (size * 3) + "+")
+        for i in range(size):
+            print("|", end=" ")
+            for j in range(size):
+                index = i * size + j
+                cell = maze[index]
+                if cell not in ['0', 'X']:
+                    if index == current:
+                        cell = '@'
+                    elif index in on_path:
+                        cell = 'o'
+                print(f"{cell}", end="  ")
+            print("|")
+        print("+" + "-" * (size * 3) + "+")
+        elapsed = self.trace.times[self.step] / 1e6 if self.step >= 0 else 0.0
+        solutions = sum(1 for s in self.trace.solutions if s <= self.step)
+        print(f"Paso {self.step + 1}/{len(self.trace)}  Soluciones: {solutions}  "
+              f"Tiempo de búsqueda: {elapsed:.6f} segundos")
+
+
+def record(size, maze_string, path):
+    solver = MazeSolver(size, maze_string, 0, render=False)
+    recorder = TraceRecorder.attach(solver, path)
+    solver._find_all_solutions()
+    recorder.close()
+    print(f"Traza guardada en {path}: {recorder.events} movimientos, "
+          f"{len(solver.solutions)} soluciones, {os.path.getsize(path)} bytes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Graba y reproduce trazas de búsqueda")
+    commands = parser.add_subparsers(dest='command', required=True)
+    grabar = commands.add_parser('grabar', help="resuelve a máxima velocidad y guarda la traza")
+    grabar.add_argument('size', type=int)
+    grabar.add_argument('maze')
+    grabar.add_argument('trace')
+    reproducir = commands.add_parser('reproducir', help="anima una traza guardada")
+    reproducir.add_argument('trace')
+    reproducir.add_argument('--retraso', type=int, default=100, help="milisegundos entre pasos")
+    reproducir.add_argument('--desde', type=int, default=0, help="paso inicial")
+    reproducir.add_argument('--hasta', type=int, help="paso final")
+    reproducir.add_argument('--solucion', type=int, help="muestra la solución k (desde 1)")
+    args = parser.parse_args()
+
+    if args.command == 'grabar':
+        if len(args.maze) != args.size * args.size:
+            print(f"Error: La cadena debe tener exactamente {args.size*args.size} caracteres")
+            return
+        record(args.size, args.maze, args.trace)
+        return
+
+    replayer = TraceReplayer(Trace(args.trace), args.retraso)
+    if args.solucion is not None:
+        replayer.seek_solution(args.solucion - 1)
+        replayer.render()
+        return
+    replayer.seek(args.desde - 1)
+    replayer.play(args.hasta)
+
+
+if __name__ == "__main__":
+    main()
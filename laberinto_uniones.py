@@ -0,0 +1,176 @@
+import heapq
+import sys
+from array import array
+
+from laberinto_busqueda import MOVES, WALL, GridMaze
+
+UNREACHABLE = -1
+
+
+# Grafo de uniones: los pasillos (celdas con dos vecinas libres) y los
+# callejones sin salida se contraen y sólo quedan como nodos las uniones y las
+# celdas '0' y 'X'. Sobre ese grafo pequeño se precalcula la tabla completa de
+# distancias (Dijkstra repetido, guardada en un array plano J x J); cada celda
+# de pasillo sólo recuerda su pasillo y su distancia al primer extremo.
+class JunctionGraph:
+    def __init__(self, grid):
+        size = self.size = grid.size
+        cells = grid.cells
+        total = size * size
+        self.junction_of = array('i', [-1]) * total
+        self.corridor_of = array('i', [-1]) * total
+        self.offset = array('i', [0]) * total
+        self.junctions = array('i')
+        self.corridor_a = array('i')
+        self.corridor_b = array('i')
+        self.corridor_length = array('i')
+        self._edges = []
+
+        degree = bytearray(total)
+        for index in range(total):
+            if cells[index] == WALL:
+                continue
+            x, y = divmod(index, size)
+            degree[index] = sum(1 for dx, dy in MOVES if grid.is_open(x + dx, y + dy))
+        self._grid = grid
+
+        for index in range(total):
+            if cells[index] != WALL and (degree[index] not in (1, 2) or
+                                         cells[index] in (ord('0'), ord('X'))):
+                self._add_junction(index)
+        for j in range(len(self.junctions)):
+            self._walk_from(j)
+        # Ciclos o tramos aislados sin ninguna unión: se promueve una celda
+        for index in range(total):
+            if (cells[index] != WALL and self.junction_of[index] == -1 and
+                    self.corridor_of[index] == -1):
+                self._walk_from(self._add_junction(index))
+
+        self.table = self._all_pairs()
+        del self._edges, self._grid
+
+    def _add_junction(self, index):
+        j = len(self.junctions)
+        self.junctions.append(index)
+        self.junction_of[index] = j
+        self._edges.append({})
+        return j
+
+    def _open_neighbors(self, index):
+        x, y = divmod(index, self.size)
+        for dx, dy in MOVES:
+            if self._grid.is_open(x + dx, y + dy):
+                yield (x + dx) * self.size + y + dy
+
+    def _walk_from(self, j):
+        start = self.junctions[j]
+        for first in self._open_neighbors(start):
+            if self.corridor_of[first] != -1:
+                continue
+            prev, cur, length = start, first, 1
+            corridor_cells = []
+            end = -1
+            while self.junction_of[cur] == -1:
+                corridor_cells.append(cur)
+                nxt = next((n for n in self._open_neighbors(cur) if n != prev), None)
+                if nxt is None:
+                    # Callejón sin salida: el pasillo sólo tiene un extremo
+                    break
+                prev, cur = cur, nxt
+                length += 1
+            else:
+                end = self.junction_of[cur]
+            if corridor_cells:
+                corridor = len(self.corridor_length)
+                self.corridor_a.append(j)
+                self.corridor_b.append(end)
+                self.corridor_length.append(length)
+                for k, cell in enumerate(corridor_cells, 1):
+                    self.corridor_of[cell] = corridor
+                    self.offset[cell] = k
+            if end != -1 and length < self._edges[j].get(end, length + 1):
+                self._edges[j][end] = length
+                self._edges[end][j] = length
+
+    def _all_pairs(self):
+        count = len(self.junctions)
+        table = array('i', [UNREACHABLE]) * (count * count)
+        for source in range(count):
+            row = source * count
+            heap = [(0, source)]
+            while heap:
+                d, j = heapq.heappop(heap)
+                if table[row + j] != UNREACHABLE:
+                    continue
+                table[row + j] = d
+                for nxt, w in self._edges[j].items():
+                    if table[row + nxt] == UNREACHABLE:
+                        heapq.heappush(heap, (d + w, nxt))
+        return table
+
+    def _anchors(self, cell):
+        index = cell[0] * self.size + cell[1]
+        j = self.junction_of[index]
+        if j != -1:
+            return ((j, 0),)
+        corridor = self.corridor_of[index]
+        if corridor == -1:
+            return ()
+        k = self.offset[index]
+        if self.corridor_b[corridor] == -1:
+            return ((self.corridor_a[corridor], k),)
+        return ((self.corridor_a[corridor], k),
+                (self.corridor_b[corridor], self.corridor_length[corridor] - k))
+
+    def distance(self, a, b):
+        if a == b:
+            return 0
+        count = len(self.junctions)
+        best = UNREACHABLE
+        ia = a[0] * self.size + a[1]
+        ib = b[0] * self.size + b[1]
+        corridor = self.corridor_of[ia]
+        if corridor != -1 and corridor == self.corridor_of[ib]:
+            best = abs(self.offset[ia] - self.offset[ib])
+        for ja, da in self._anchors(a):
+            row = ja * count
+            for jb, db in self._anchors(b):
+                middle = self.table[row + jb]
+                if middle != UNREACHABLE:
+                    d = da + middle + db
+                    if best == UNREACHABLE or d < best:
+                        best = d
+        return best
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Uso: python laberinto_uniones.py <tamaño> [semilla] [densidad_ciclos]")
+        return
+    import random
+    import time
+    from laberinto_generador import generate
+
+    size = int(sys.argv[1])
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    loops = float(sys.argv[3]) if len(sys.argv) > 3 else 0.0
+    grid = GridMaze(size, generate(size, 'kruskal', seed, loops=loops))
+    started = time.perf_counter()
+    graph = JunctionGraph(grid)
+    built = time.perf_counter() - started
+
+    rng = random.Random(seed)
+    free = [divmod(i, size) for i, c in enumerate(grid.cells) if c != WALL]
+    pairs = [(rng.choice(free), rng.choice(free)) for _ in range(10000)]
+    started = time.perf_counter()
+    for a, b in pairs:
+        graph.distance(a, b)
+    per_query = (time.perf_counter() - started) / len(pairs)
+    print(f"{len(free)} celdas libres, {len(graph.junctions)} uniones, "
+          f"{len(graph.corridor_length)} pasillos")
+    print(f"Preproceso: {built:.3f} segundos")
+    print(f"Consulta: {per_query * 1e6:.2f} microsegundos")
+
+
+if __name__ == "__main__":
+    main()